@@ -1,5 +1,7 @@
 """Base agent class for PentestAgent."""
 
+import asyncio
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, AsyncIterator, List, Optional
@@ -425,154 +427,157 @@ class BaseAgent(ABC):
         """
         Execute tool calls and return results.
 
+        Calls run concurrently on the event loop, so a batch of I/O-bound
+        tools costs the slowest call rather than the sum; result order
+        matches call order.
+
         Args:
             tool_calls: List of tool calls from the LLM
 
         Returns:
             List of ToolResult objects
         """
-        results = []
-
-        for i, call in enumerate(tool_calls):
-            # Extract tool call id, name and arguments
-            if hasattr(call, "id"):
-                tool_call_id = call.id
-            elif isinstance(call, dict) and "id" in call:
-                tool_call_id = call["id"]
-            else:
-                tool_call_id = f"call_{i}"
-
-            if hasattr(call, "function"):
-                name = call.function.name
-                arguments = self._parse_arguments(call)
-            elif isinstance(call, dict):
-                name = call.get("name", "")
-                arguments = call.get("arguments", {})
-            else:
-                continue
+        results = await asyncio.gather(
+            *(self._execute_tool_call(i, call) for i, call in enumerate(tool_calls))
+        )
+        return [r for r in results if r is not None]
+
+    async def _execute_tool_call(self, i: int, call: Any) -> Optional[ToolResult]:
+        """Parse, scope-check and execute a single tool call."""
+        # Extract tool call id, name and arguments
+        if hasattr(call, "id"):
+            tool_call_id = call.id
+        elif isinstance(call, dict) and "id" in call:
+            tool_call_id = call["id"]
+        else:
+            tool_call_id = f"call_{i}"
+
+        if hasattr(call, "function"):
+            name = call.function.name
+            arguments = self._parse_arguments(call)
+        elif isinstance(call, dict):
+            name = call.get("name", "")
+            arguments = call.get("arguments", {})
+        else:
+            return None
 
-            tool = self._find_tool(name)
+        tool = self._find_tool(name)
 
-            if tool:
-                try:
-                    # Before executing, enforce target safety gate when workspace active
-                    wm = WorkspaceManager()
-                    active = wm.get_active()
-
-                    # Use centralized validation helpers for target extraction and scope checks
-                    candidates = validation.gather_candidate_targets(arguments)
-                    out_of_scope = []
-                    if active:
-                        allowed = wm.list_targets(active)
-                        for c in candidates:
-                            try:
-                                if not validation.is_target_in_scope(c, allowed):
-                                    out_of_scope.append(c)
-                            except Exception as e:
-                                import logging
-                                logging.getLogger(__name__).exception(
-                                    "Error validating candidate target %s: %s", c, e
-                                )
-                                out_of_scope.append(c)
-
-                    if active and out_of_scope:
-                        # Block execution and return an explicit error requiring operator confirmation
-                        results.append(
-                            ToolResult(
-                                tool_call_id=tool_call_id,
-                                tool_name=name,
-                                error=(
-                                    f"Out-of-scope target(s): {out_of_scope} - operator confirmation required. "
-                                    "Set workspace targets with /target or run tool manually."
-                                ),
-                                success=False,
-                            )
+        if tool:
+            try:
+                # Before executing, enforce target safety gate when workspace active
+                wm = WorkspaceManager()
+                active = wm.get_active()
+
+                # Use centralized validation helpers for target extraction and scope checks
+                candidates = validation.gather_candidate_targets(arguments)
+                out_of_scope = []
+                if active:
+                    allowed = wm.list_targets(active)
+                    # Batch check: the allowlist is compiled once for all
+                    # candidates instead of once per candidate
+                    in_scope = validation.are_targets_in_scope(candidates, allowed)
+                    out_of_scope = [
+                        c for c, ok in zip(candidates, in_scope) if not ok
+                    ]
+
+                if active and out_of_scope:
+                    # Block execution and return an explicit error requiring operator confirmation
+                    return (
+                        ToolResult(
+                            tool_call_id=tool_call_id,
+                            tool_name=name,
+                            error=(
+                                f"Out-of-scope target(s): {out_of_scope} - operator confirmation required. "
+                                "Set workspace targets with /target or run tool manually."
+                            ),
+                            success=False,
                         )
-                    else:
-                        # If the tool is the generic terminal fallback but the LLM
-                        # requested a specific tool name (e.g. 'nmap'), construct
-                        # a sensible command string from the provided arguments
-                        # so the terminal tool can execute it. This handles
-                        # LLMs that call semantic tool names which aren't
-                        # registered as explicit tools.
-                        if tool.name == "terminal" and name != "terminal":
-                            # If the LLM already provided a raw 'command', prefer it
-                            if isinstance(arguments, dict) and "command" in arguments:
-                                terminal_args = arguments
-                            else:
-                                # Build a best-effort command: tool name + positional
-                                # argument values joined by space. This is intentionally
-                                # simple to avoid over-guessing flag semantics.
-                                cmd_parts = [name]
-                                if isinstance(arguments, dict):
-                                    # Prefer common keys like 'target' or 'hosts' first
-                                    for k in ("target", "host", "hosts", "hosts_list", "hosts[]"):
-                                        if k in arguments:
-                                            v = arguments[k]
-                                            if isinstance(v, (list, tuple)):
-                                                cmd_parts.extend([str(x) for x in v])
-                                            else:
-                                                cmd_parts.append(str(v))
-                                    # Append any remaining values
-                                    for k, v in arguments.items():
-                                        if k in ("target", "host", "hosts", "hosts_list", "hosts[]"):
-                                            continue
-                                        if v is True:
-                                            cmd_parts.append(f"--{k}")
-                                        elif v is False or v is None:
-                                            continue
-                                        elif isinstance(v, (list, tuple)):
+                    )
+                else:
+                    # If the tool is the generic terminal fallback but the LLM
+                    # requested a specific tool name (e.g. 'nmap'), construct
+                    # a sensible command string from the provided arguments
+                    # so the terminal tool can execute it. This handles
+                    # LLMs that call semantic tool names which aren't
+                    # registered as explicit tools.
+                    if tool.name == "terminal" and name != "terminal":
+                        # If the LLM already provided a raw 'command', prefer it
+                        if isinstance(arguments, dict) and "command" in arguments:
+                            terminal_args = arguments
+                        else:
+                            # Build a best-effort command: tool name + positional
+                            # argument values joined by space. This is intentionally
+                            # simple to avoid over-guessing flag semantics.
+                            cmd_parts = [name]
+                            if isinstance(arguments, dict):
+                                # Prefer common keys like 'target' or 'hosts' first
+                                for k in ("target", "host", "hosts", "hosts_list", "hosts[]"):
+                                    if k in arguments:
+                                        v = arguments[k]
+                                        if isinstance(v, (list, tuple)):
                                             cmd_parts.extend([str(x) for x in v])
                                         else:
                                             cmd_parts.append(str(v))
-                                elif isinstance(arguments, (list, tuple)):
-                                    cmd_parts.extend([str(x) for x in arguments])
-                                else:
-                                    # Fallback: append as single positional
-                                    cmd_parts.append(str(arguments))
-
-                                terminal_args = {"command": " ".join(cmd_parts)}
-
-                            result = await tool.execute(terminal_args, self.runtime)
-                        else:
-                            result = await tool.execute(arguments, self.runtime)
-                        results.append(
-                            ToolResult(
-                                tool_call_id=tool_call_id,
-                                tool_name=name,
-                                result=result,
-                                success=True,
-                            )
-                        )
-                except Exception as e:
-                    import logging
+                                # Append any remaining values
+                                for k, v in arguments.items():
+                                    if k in ("target", "host", "hosts", "hosts_list", "hosts[]"):
+                                        continue
+                                    if v is True:
+                                        cmd_parts.append(f"--{k}")
+                                    elif v is False or v is None:
+                                        continue
+                                    elif isinstance(v, (list, tuple)):
+                                        cmd_parts.extend([str(x) for x in v])
+                                    else:
+                                        cmd_parts.append(str(v))
+                            elif isinstance(arguments, (list, tuple)):
+                                cmd_parts.extend([str(x) for x in arguments])
+                            else:
+                                # Fallback: append as single positional
+                                cmd_parts.append(str(arguments))
 
-                    logging.getLogger(__name__).exception("Error executing tool %s: %s", name, e)
-                    try:
-                        from ..interface.notifier import notify
+                            terminal_args = {"command": " ".join(cmd_parts)}
 
-                        notify("warning", f"Tool execution failed ({name}): {e}")
-                    except Exception:
-                        logging.getLogger(__name__).exception("Failed to notify operator about tool execution failure")
-                    results.append(
+                        result = await tool.execute(terminal_args, self.runtime)
+                    else:
+                        result = await tool.execute(arguments, self.runtime)
+                    return (
                         ToolResult(
                             tool_call_id=tool_call_id,
                             tool_name=name,
-                            error=str(e),
-                            success=False,
+                            result=result,
+                            success=True,
                         )
                     )
-            else:
-                results.append(
+            except Exception as e:
+                import logging
+
+                logging.getLogger(__name__).exception("Error executing tool %s: %s", name, e)
+                try:
+                    from ..interface.notifier import notify
+
+                    notify("warning", f"Tool execution failed ({name}): {e}")
+                except Exception:
+                    logging.getLogger(__name__).exception("Failed to notify operator about tool execution failure")
+                return (
                     ToolResult(
                         tool_call_id=tool_call_id,
                         tool_name=name,
-                        error=f"Tool '{name}' not found",
+                        error=str(e),
                         success=False,
                     )
                 )
+        else:
+            return (
+                ToolResult(
+                    tool_call_id=tool_call_id,
+                    tool_name=name,
+                    error=f"Tool '{name}' not found",
+                    success=False,
+                )
+            )
 
-        return results
 
     def _find_tool(self, name: str) -> Optional["Tool"]:
         """
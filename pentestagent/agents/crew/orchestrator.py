@@ -58,9 +58,9 @@ class CrewOrchestrator:
         notes_context = ""
         graph_insights = []
         try:
-            from ...tools.notes import get_all_notes_sync
+            from ...tools.notes import get_all_notes_view
 
-            notes = get_all_notes_sync()
+            notes = get_all_notes_view()
             if notes:
                 # Update shadow graph
                 self.graph.update_from_notes(notes)
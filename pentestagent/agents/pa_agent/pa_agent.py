@@ -67,9 +67,9 @@ class PentestAgentAgent(BaseAgent):
         # Get saved notes if available
         notes_context = ""
         try:
-            from ...tools.notes import get_all_notes_sync
+            from ...tools.notes import get_all_notes_view
 
-            notes = get_all_notes_sync()
+            notes = get_all_notes_view()
             if notes:
                 # Group by category
                 grouped = {}
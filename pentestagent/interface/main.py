@@ -8,6 +8,15 @@ from ..config.constants import AGENT_MAX_ITERATIONS, DEFAULT_MODEL
 from .cli import run_cli
 from .tui import run_tui
 
+try:
+    # libuv-based event loop: lower per-I/O overhead for the subprocess-
+    # and network-heavy tool paths; every asyncio.run below picks it up
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass  # not installed (or Windows) — the stdlib loop works fine
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -739,16 +748,29 @@ def handle_workspace_command(args: argparse.Namespace):
             loot_dir = (wm.workspace_path(name) / "loot").resolve()
             size = 0
             files = 0
+
+            # Best-effort loot stats via scandir recursion: entry.stat()
+            # works off the open directory fd, so each file costs one
+            # syscall instead of a full-path getsize after the walk
+            def _tally(dirpath):
+                nonlocal size, files
+                try:
+                    with os.scandir(dirpath) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    _tally(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    size += entry.stat(follow_symlinks=False).st_size
+                                    files += 1
+                            except OSError:
+                                # Skip entries we can't stat (permissions, broken symlinks)
+                                pass
+                except OSError:
+                    pass
+
             if loot_dir.exists():
-                for rootp, _, filenames in os.walk(loot_dir):
-                    for fn in filenames:
-                        try:
-                            fp = os.path.join(rootp, fn)
-                            size += os.path.getsize(fp)
-                            files += 1
-                        except Exception:
-                            # Best-effort loot stats: skip files we can't stat (e.g., permissions, broken symlinks)
-                            pass
+                _tally(loot_dir)
 
             print(f"Name: {name}")
             print(f"Created: {created}")
@@ -4,12 +4,25 @@ Modules can call `notify(level, message)` to emit operator-visible
 notifications. A UI (TUI) may register a callback via `register_callback()`
 to receive notifications and display them. If no callback is registered,
 notifications are logged.
+
+An optional JSONL event log can be enabled with `enable_event_log()`:
+events are queued and drained by a single background writer task, so
+notify() callers never block on file I/O and concurrent call sites don't
+serialize on the file.
 """
+import asyncio
+import json
 import logging
-from typing import Callable, Optional
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 _callback: Optional[Callable[[str, str], None]] = None
 
+_event_queue: "Optional[asyncio.Queue]" = None
+_event_log_path: Optional[Path] = None
+_writer_task: "Optional[asyncio.Task]" = None
+
 
 def register_callback(cb: Callable[[str, str], None]) -> None:
     """Register a callback to receive notifications.
@@ -20,9 +33,58 @@ def register_callback(cb: Callable[[str, str], None]) -> None:
     _callback = cb
 
 
+def _flush_events(path: Path, batch: List[Tuple[float, str, str]]) -> None:
+    """Append a batch of events to the JSONL log (runs in a worker thread)."""
+    with path.open("a", encoding="utf-8") as f:
+        for ts, level, message in batch:
+            f.write(json.dumps({"ts": ts, "level": level, "message": message}) + "\n")
+
+
+async def _event_writer() -> None:
+    """Drain the event queue in batches: one file open per burst of events."""
+    while True:
+        batch = [await _event_queue.get()]
+        while not _event_queue.empty():
+            batch.append(_event_queue.get_nowait())
+        try:
+            await asyncio.to_thread(_flush_events, _event_log_path, batch)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to write notification log")
+
+
+def enable_event_log(path: Path) -> None:
+    """Persist notifications as JSONL at `path`.
+
+    Must be called with a running event loop; starts the single writer
+    task on first use.
+    """
+    global _event_queue, _event_log_path, _writer_task
+    _event_log_path = Path(path)
+    if _event_queue is None:
+        _event_queue = asyncio.Queue()
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.get_running_loop().create_task(_event_writer())
+
+
+def disable_event_log() -> None:
+    """Stop persisting notifications; queued events may be dropped."""
+    global _event_queue, _event_log_path, _writer_task
+    if _writer_task is not None:
+        _writer_task.cancel()
+    _writer_task = None
+    _event_queue = None
+    _event_log_path = None
+
+
 def notify(level: str, message: str) -> None:
     """Emit a notification. If UI callback registered, call it; otherwise log."""
     global _callback
+    if _event_queue is not None:
+        try:
+            _event_queue.put_nowait((time.time(), level, message))
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to queue notification")
+
     if _callback:
         try:
             _callback(level, message)
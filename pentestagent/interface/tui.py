@@ -2019,11 +2019,11 @@ Be concise. Use the actual data from notes."""
             # Append Shadow Graph if available
             try:
                 from ..knowledge.graph import ShadowGraph
-                from ..tools.notes import get_all_notes_sync
+                from ..tools.notes import get_all_notes_view
 
                 # Rehydrate graph from notes
                 graph = ShadowGraph()
-                notes = get_all_notes_sync()
+                notes = get_all_notes_view()
                 if notes:
                     graph.update_from_notes(notes)
                     mermaid_code = graph.to_mermaid()
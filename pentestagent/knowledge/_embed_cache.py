@@ -0,0 +1,58 @@
+"""Content-addressed embedding cache.
+
+Chunks are keyed by SHA-256 of (model, chunk text), so re-indexing after a
+small source change only embeds the chunks that actually changed; unchanged
+chunks are served from a local sqlite database as raw vector bytes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+# sqlite caps host parameters per statement (999 by default); keep IN
+# queries comfortably below that
+_SELECT_BATCH = 500
+
+
+def chunk_key(model: str, text: str) -> str:
+    """Stable cache key for one chunk under one embedding model."""
+    h = sha256(model.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+class EmbedCache:
+    """sqlite-backed map from chunk hash to stored embedding bytes."""
+
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb (hash TEXT PRIMARY KEY, vec BLOB)"
+        )
+        self._conn.commit()
+
+    def get_many(self, hashes: List[str]) -> Dict[str, bytes]:
+        """Return the cached vectors for whichever of `hashes` are present."""
+        out: Dict[str, bytes] = {}
+        for start in range(0, len(hashes), _SELECT_BATCH):
+            batch = hashes[start : start + _SELECT_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT hash, vec FROM emb WHERE hash IN ({placeholders})", batch
+            )
+            out.update(rows.fetchall())
+        return out
+
+    def put_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """Store (hash, vector bytes) pairs, replacing existing entries."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO emb (hash, vec) VALUES (?, ?)", list(items)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,8 +1,16 @@
 """Embedding generation for PentestAgent."""
 
+from __future__ import annotations
+
 from typing import List, Optional
 
-import numpy as np
+# numpy is imported inside each function so importing this module (it is
+# re-exported from the package __init__) stays cheap for callers that
+# never compute embeddings
+
+# Texts per embedding API request: amortizes per-request overhead while
+# keeping individual requests well under provider payload limits
+_EMBED_BATCH_SIZE = 64
 
 
 def get_embeddings(
@@ -11,6 +19,8 @@ def get_embeddings(
     """
     Generate embeddings for a list of texts using LiteLLM.
 
+    Texts are sent in batches of up to 64 per request.
+
     Args:
         texts: List of texts to embed
         model: The embedding model to use
@@ -18,12 +28,17 @@ def get_embeddings(
     Returns:
         NumPy array of embeddings
     """
+    import numpy as np
+
     try:
         import litellm
 
-        response = litellm.embedding(model=model, input=texts)
-
-        embeddings = [item["embedding"] for item in response.data]
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), _EMBED_BATCH_SIZE):
+            response = litellm.embedding(
+                model=model, input=texts[start : start + _EMBED_BATCH_SIZE]
+            )
+            embeddings.extend(item["embedding"] for item in response.data)
         return np.array(embeddings, dtype=np.float32)
 
     except ImportError as e:
@@ -47,6 +62,8 @@ def get_embeddings_local(
     Returns:
         NumPy array of embeddings
     """
+    import numpy as np
+
     try:
         from sentence_transformers import SentenceTransformer
 
@@ -72,6 +89,8 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     Returns:
         Cosine similarity score
     """
+    import numpy as np
+
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-10)
 
 
@@ -86,6 +105,8 @@ def batch_cosine_similarity(query: np.ndarray, embeddings: np.ndarray) -> np.nda
     Returns:
         Array of similarity scores
     """
+    import numpy as np
+
     query_norm = np.linalg.norm(query)
     embeddings_norm = np.linalg.norm(embeddings, axis=1)
 
@@ -10,15 +10,93 @@ Architecture:
     Notes (Source of Truth) -> Shadow Graph (Derived View) -> Insights (Strategic Hints)
 """
 
+import functools
+import ipaddress
 import logging
 import re
+import sys
+from collections import defaultdict, deque
+from itertools import chain
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
 logger = logging.getLogger(__name__)
 
+# All content-fallback entities in one alternation, compiled once at
+# import, so a note is scanned in a single linear pass instead of once
+# per pattern
+_ENTITY_RE = re.compile(
+    r"(?P<ip>\b(?:\d{1,3}\.){3}\d{1,3}\b)"
+    r"|(?i:(?:user|username)[:\s]+(?P<user>[a-zA-Z0-9_.-]+))"
+    r"|(?i:(?P<cve>CVE-\d{4}-\d{4,7}))"
+)
+_EMPTY_ENTITIES: Dict[str, List[str]] = {"ips": [], "users": [], "cves": []}
+
+# Mermaid export helpers: precompiled id sanitizer and per-type emoji
+# prefixes, looked up once per node instead of an if-chain per iteration
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9]")
+_MERMAID_PREFIX = {
+    "host": "\U0001f5a5\ufe0f ",
+    "credential": "\U0001f511 ",
+    "vulnerability": "\u26a0\ufe0f ",
+    "service": "\U0001f50c ",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _valid_ip(s: str) -> bool:
+    """Check whether a regex candidate is a real IP address.
+
+    The IP pattern matches octet-shaped junk like 999.999.999.999; caching
+    amortizes the ipaddress parse for addresses repeated across notes.
+    """
+    try:
+        ipaddress.ip_address(s)
+    except ValueError:
+        return False
+    return True
+
+
+def _scan_entities(content: str) -> Dict[str, List[str]]:
+    """Collect IPs, usernames and CVE IDs from text in one regex pass."""
+    ips: List[str] = []
+    users: List[str] = []
+    cves: List[str] = []
+    for m in _ENTITY_RE.finditer(content):
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "ip":
+            if _valid_ip(value):
+                ips.append(value)
+        elif kind == "user":
+            users.append(value)
+        else:
+            cves.append(value)
+    # Order-preserving dedup: repeated mentions of a host in one note
+    # shouldn't churn _add_node
+    return {"ips": list(dict.fromkeys(ips)), "users": users, "cves": cves}
+
 
 @dataclass
 class GraphNode:
@@ -51,17 +129,21 @@ class ShadowGraph:
     def __init__(self):
         self.graph = nx.DiGraph()
         self._processed_notes: Set[str] = set()
-
-        # Regex patterns for entity extraction
-        self._ip_pattern = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
-        self._port_pattern = re.compile(r"(\d{1,5})/(tcp|udp)")
-        self._user_pattern = re.compile(
-            r"(?:user|username)[:\s]+([a-zA-Z0-9_.-]+)", re.IGNORECASE
-        )
-        self._source_pattern = re.compile(
-            r"(?:found on|dumped from|extracted from|on host)\s+((?:\d{1,3}\.){3}\d{1,3})",
-            re.IGNORECASE,
-        )
+        # Batch buffers active only inside update_from_notes, so a whole
+        # update lands via add_nodes_from/add_edges_from instead of one
+        # NetworkX call per entity
+        self._pending_nodes: Optional[Dict[str, Tuple[str, Dict[str, Any]]]] = None
+        self._pending_edges: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+        # Columnar per-type node index, maintained on insert. Nodes are
+        # never removed, so insights/export code can look up a type bucket
+        # directly instead of rescanning every node's attribute dict.
+        self._nodes_by_type: Dict[str, List[str]] = defaultdict(list)
+        # Structural version, bumped on every mutation. Derived outputs
+        # (attack paths, mermaid) are memoized against it so repeated
+        # queries on an unchanged graph don't re-traverse it.
+        self._version = 0
+        self._cached_paths: Optional[Tuple[int, List[str]]] = None
+        self._cached_mermaid: Optional[Tuple[int, str]] = None
 
     def update_from_notes(self, notes: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -70,24 +152,39 @@ class ShadowGraph:
         This method is idempotent and incremental. It only processes notes
         that haven't been seen before (based on key).
         """
-        for key, note_data in notes.items():
-            if key in self._processed_notes:
-                continue
+        # Normalize legacy string notes up front so the hot loop below can
+        # treat every entry as a structured dict without per-item isinstance.
+        if any(isinstance(v, str) for v in notes.values()):
+            notes = {
+                k: {"content": v} if isinstance(v, str) else v
+                for k, v in notes.items()
+            }
+
+        self._pending_nodes = {}
+        self._pending_edges = []
+        try:
+            for key, note_data in notes.items():
+                if key in self._processed_notes:
+                    continue
 
-            # Handle legacy format
-            if isinstance(note_data, str):
-                content = note_data
-                category = "info"
-                metadata = {}
-                status = "confirmed"
-            else:
                 content = note_data.get("content", "")
                 category = note_data.get("category", "info")
                 metadata = note_data.get("metadata", {})
                 status = note_data.get("status", "confirmed")
 
-            self._process_note(key, content, category, metadata, status)
-            self._processed_notes.add(key)
+                self._process_note(key, content, category, metadata, status)
+                self._processed_notes.add(key)
+
+            self.graph.add_nodes_from(self._pending_nodes.values())
+            self.graph.add_edges_from(self._pending_edges)
+            # Index only nodes that actually landed in the graph
+            for node_id, attrs in self._pending_nodes.values():
+                self._nodes_by_type[attrs["type"]].append(node_id)
+            if self._pending_nodes or self._pending_edges:
+                self._version += 1
+        finally:
+            self._pending_nodes = None
+            self._pending_edges = None
 
     def _process_note(
         self,
@@ -99,6 +196,29 @@ class ShadowGraph:
     ) -> None:
         """Extract entities and relationships from a single note."""
 
+        # Decide which processors run before scanning, so notes whose
+        # metadata already carries the entities skip the content scan
+        wants_credential = (
+            category == "credential"
+            or metadata.get("username")
+            or metadata.get("password")
+        )
+        wants_vulnerability = (
+            category == "vulnerability"
+            or metadata.get("cve")
+            or metadata.get("weaknesses")
+        )
+        needs_scan = content and (
+            not (metadata.get("target") or metadata.get("source"))
+            or (wants_credential and not metadata.get("username"))
+            or (
+                wants_vulnerability
+                and not metadata.get("cve")
+                and not metadata.get("weaknesses")
+            )
+        )
+        entities = _scan_entities(content) if needs_scan else _EMPTY_ENTITIES
+
         # 1. Extract IPs (Hosts)
         # Prefer metadata if available
         hosts = []
@@ -107,22 +227,21 @@ class ShadowGraph:
         if metadata.get("target"):
             target_ip = metadata["target"]
             # Validate it looks like an IP or hostname? For now just accept it.
-            node_id = f"host:{target_ip}"
+            node_id = sys.intern("host:" + target_ip)
             self._add_node(node_id, "host", target_ip)
             hosts.append(node_id)
 
         # Check source in metadata
         if metadata.get("source"):
             source_ip = metadata["source"]
-            node_id = f"host:{source_ip}"
+            node_id = sys.intern("host:" + source_ip)
             self._add_node(node_id, "host", source_ip)
             hosts.append(node_id)
 
-        # Fallback to regex if no hosts found in metadata
+        # Fallback to the scanned entities if no hosts found in metadata
         if not hosts:
-            ips = self._ip_pattern.findall(content)
-            for ip in ips:
-                node_id = f"host:{ip}"
+            for ip in entities["ips"]:
+                node_id = sys.intern("host:" + ip)
                 self._add_node(node_id, "host", ip)
                 hosts.append(node_id)
 
@@ -130,12 +249,8 @@ class ShadowGraph:
         # Category is organizational only - the metadata structure determines graph entities
 
         # Process credential data if present
-        if (
-            category == "credential"
-            or metadata.get("username")
-            or metadata.get("password")
-        ):
-            self._process_credential(key, content, hosts, metadata, status)
+        if wants_credential:
+            self._process_credential(key, entities, hosts, metadata, status)
 
         # Process services/endpoints/technologies if present
         if (
@@ -147,31 +262,48 @@ class ShadowGraph:
             self._process_services_and_tech(key, content, hosts, metadata, status)
 
         # Process vulnerability data if present
-        if (
-            category == "vulnerability"
-            or metadata.get("cve")
-            or metadata.get("weaknesses")
-        ):
-            self._process_vulnerability(key, content, hosts, metadata, status)
+        if wants_vulnerability:
+            self._process_vulnerability(key, entities, hosts, metadata, status)
 
         # 3. Link note to hosts (provenance)
         # We don't add the note itself as a node usually, but we could.
         # For now, we just use the note to build Host-to-Host or Host-to-Service links.
 
     def _add_node(self, node_id: str, node_type: str, label: str, **kwargs) -> None:
-        """Add a node if it doesn't exist."""
-        if not self.graph.has_node(node_id):
+        """Add a node if it doesn't exist (buffered during an update)."""
+        if self.graph.has_node(node_id):
+            return
+        if self._pending_nodes is not None:
+            if node_id not in self._pending_nodes:
+                self._pending_nodes[node_id] = (
+                    node_id,
+                    {"type": node_type, "label": label, **kwargs},
+                )
+        else:
             self.graph.add_node(node_id, type=node_type, label=label, **kwargs)
+            self._nodes_by_type[node_type].append(node_id)
+            self._version += 1
+
+    def _has_or_pending(self, node_id: str) -> bool:
+        """True if the node exists in the graph or the current batch."""
+        if self.graph.has_node(node_id):
+            return True
+        return self._pending_nodes is not None and node_id in self._pending_nodes
 
     def _add_edge(self, source: str, target: str, edge_type: str, **kwargs) -> None:
-        """Add an edge."""
-        if self.graph.has_node(source) and self.graph.has_node(target):
+        """Add an edge (buffered during an update)."""
+        if not (self._has_or_pending(source) and self._has_or_pending(target)):
+            return
+        if self._pending_edges is not None:
+            self._pending_edges.append((source, target, {"type": edge_type, **kwargs}))
+        else:
             self.graph.add_edge(source, target, type=edge_type, **kwargs)
+            self._version += 1
 
     def _process_credential(
         self,
         key: str,
-        content: str,
+        entities: Dict[str, List[str]],
         related_hosts: List[str],
         metadata: Dict[str, Any],
         status: str,
@@ -184,10 +316,9 @@ class ShadowGraph:
         # Extract username (with fallback for legacy notes)
         username = metadata.get("username")
         if not username:
-            user_match = self._user_pattern.search(content)
-            username = user_match.group(1) if user_match else "unknown"
+            username = entities["users"][0] if entities["users"] else "unknown"
 
-        cred_id = f"cred:{key}"
+        cred_id = sys.intern("cred:" + key)
         label = f"Creds ({username})" if username != "unknown" else "Credentials"
         self._add_node(cred_id, "credential", label)
 
@@ -195,8 +326,8 @@ class ShadowGraph:
         source_host = None
         if metadata.get("source"):
             source_ip = metadata["source"]
-            source_host = f"host:{source_ip}"
-            if self.graph.has_node(source_host):
+            source_host = sys.intern("host:" + source_ip)
+            if self._has_or_pending(source_host):
                 self._add_edge(source_host, cred_id, "CONTAINS")
 
         # Link cred to target hosts (AUTH_ACCESS)
@@ -225,7 +356,7 @@ class ShadowGraph:
         target_hosts = related_hosts
         if metadata.get("target"):
             target_ip = metadata["target"]
-            target_id = f"host:{target_ip}"
+            target_id = sys.intern("host:" + target_ip)
             if target_id in related_hosts:
                 target_hosts = [target_id]
 
@@ -241,7 +372,7 @@ class ShadowGraph:
                 proto = svc.get("protocol", "tcp")
 
                 for host_id in target_hosts:
-                    service_id = f"service:{host_id}:{port}"
+                    service_id = sys.intern(f"service:{host_id}:{port}")
                     label = f"{port}/{proto}"
                     if product:
                         label += f" {product}"
@@ -301,7 +432,7 @@ class ShadowGraph:
                 port_str, proto = port_str.split("/")
 
             for host_id in target_hosts:
-                service_id = f"service:{host_id}:{port_str}"
+                service_id = sys.intern(f"service:{host_id}:{port_str}")
                 label = f"{port_str}/{proto}"
                 if metadata.get("url"):
                     label += f" ({metadata['url']})"
@@ -312,7 +443,7 @@ class ShadowGraph:
     def _process_vulnerability(
         self,
         key: str,
-        content: str,
+        entities: Dict[str, List[str]],
         related_hosts: List[str],
         metadata: Dict[str, Any],
         status: str,
@@ -326,11 +457,11 @@ class ShadowGraph:
         target_hosts = related_hosts
         if metadata.get("target"):
             target_ip = metadata["target"]
-            target_id = f"host:{target_ip}"
+            target_id = sys.intern("host:" + target_ip)
             if target_id in related_hosts:
                 target_hosts = [target_id]
 
-        vuln_id = f"vuln:{key}"
+        vuln_id = sys.intern("vuln:" + key)
 
         # Get label from CVE or first weakness ID
         label = "Vulnerability"
@@ -340,74 +471,70 @@ class ShadowGraph:
             # Use first weakness ID as label
             first_weakness = metadata["weaknesses"][0]
             label = first_weakness.get("id", "Vulnerability")
+        else:
+            # Fallback: pull a CVE ID out of the scanned note content
+            if entities["cves"]:
+                label = entities["cves"][0].upper()
 
         self._add_node(vuln_id, "vulnerability", label)
 
         for host_id in target_hosts:
             self._add_edge(host_id, vuln_id, "AFFECTED_BY")
 
+    def _collect_by_type(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Bucket all nodes by type from the maintained per-type index."""
+        nodes = self.graph.nodes
+        buckets: Dict[str, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+        for node_type, node_ids in self._nodes_by_type.items():
+            buckets[node_type] = [(n, nodes[n]) for n in node_ids]
+        return buckets
+
     def get_strategic_insights(self) -> List[str]:
         """
         Analyze the graph and return natural language insights for the Orchestrator.
         """
         insights = []
+        by_type = self._collect_by_type()
 
         # Insight 1: Unused Credentials
         # Find credentials that have AUTH_ACCESS to a host, but we haven't "explored" that host fully?
         # Or simply list valid access paths.
-        for node, data in self.graph.nodes(data=True):
-            if data.get("type") == "credential":
-                # Find what it connects to
-                targets = [v for u, v in self.graph.out_edges(node)]
-                if targets:
-                    target_labels = [
-                        self.graph.nodes[t].get("label", t) for t in targets
-                    ]
-                    insights.append(
-                        f"We have credentials that provide access to: {', '.join(target_labels)}"
-                    )
+        for node, data in by_type["credential"]:
+            # Find what it connects to
+            targets = [v for u, v in self.graph.out_edges(node)]
+            if targets:
+                target_labels = [self.graph.nodes[t].get("label", t) for t in targets]
+                insights.append(
+                    f"We have credentials that provide access to: {', '.join(target_labels)}"
+                )
 
         # Insight 2: High Value Targets (Hosts with many open ports/vulns/endpoints)
-        for node, data in self.graph.nodes(data=True):
-            if data.get("type") == "host":
-                # Count services
-                services = [
-                    v
-                    for u, v in self.graph.out_edges(node)
-                    if self.graph.nodes[v].get("type") == "service"
-                ]
-                vulns = [
-                    v
-                    for u, v in self.graph.out_edges(node)
-                    if self.graph.nodes[v].get("type") == "vulnerability"
-                ]
-                endpoints = [
-                    v
-                    for u, v in self.graph.out_edges(node)
-                    if self.graph.nodes[v].get("type") == "endpoint"
-                ]
-                technologies = [
-                    v
-                    for u, v in self.graph.out_edges(node)
-                    if self.graph.nodes[v].get("type") == "technology"
-                ]
-
-                if (
-                    len(services) > 0
-                    or len(vulns) > 0
-                    or len(endpoints) > 0
-                    or len(technologies) > 0
-                ):
-                    parts = []
-                    if len(services) > 0:
-                        parts.append(f"{len(services)} services")
-                    if len(endpoints) > 0:
-                        parts.append(f"{len(endpoints)} endpoints")
-                    if len(technologies) > 0:
-                        parts.append(f"{len(technologies)} technologies")
-                    if len(vulns) > 0:
-                        parts.append(f"{len(vulns)} vulnerabilities")
-                    insights.append(f"Host {data['label']} has {', '.join(parts)}.")
+        for node, data in by_type["host"]:
+            # Bucket neighbours by type in one pass over the out-edges
+            neighbours = defaultdict(list)
+            for u, v in self.graph.out_edges(node):
+                neighbours[self.graph.nodes[v].get("type")].append(v)
+            services = neighbours["service"]
+            vulns = neighbours["vulnerability"]
+            endpoints = neighbours["endpoint"]
+            technologies = neighbours["technology"]
+
+            if (
+                len(services) > 0
+                or len(vulns) > 0
+                or len(endpoints) > 0
+                or len(technologies) > 0
+            ):
+                parts = []
+                if len(services) > 0:
+                    parts.append(f"{len(services)} services")
+                if len(endpoints) > 0:
+                    parts.append(f"{len(endpoints)} endpoints")
+                if len(technologies) > 0:
+                    parts.append(f"{len(technologies)} technologies")
+                if len(vulns) > 0:
+                    parts.append(f"{len(vulns)} vulnerabilities")
+                insights.append(f"Host {data['label']} has {', '.join(parts)}.")
 
         # Insight 3: Potential Pivots (Host A -> Cred -> Host B)
         # Use NetworkX to find paths from Credentials to Hosts that aren't directly connected
@@ -417,93 +544,148 @@ class ShadowGraph:
 
         return insights
 
+    def _bfs_parents(self, src: str, cutoff: int = 6) -> Dict[str, str]:
+        """
+        Breadth-first search from `src` recording parent pointers.
+
+        Returns a mapping of reached node -> predecessor, bounded by `cutoff`
+        hops. Paths are reconstructed lazily by the caller, only for the few
+        endpoints actually reported.
+        """
+        parents: Dict[str, str] = {}
+        queue = deque([(src, 0)])
+        adj = self.graph.adj
+        while queue:
+            node, depth = queue.popleft()
+            if depth >= cutoff:
+                continue
+            for neighbor in adj[node]:
+                if neighbor != src and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append((neighbor, depth + 1))
+        return parents
+
     def _find_attack_paths(self) -> List[str]:
         """
-        Find multi-step attack paths using shortest path algorithms.
+        Find multi-step attack paths via parent-pointer BFS.
         Example: Credential A -> Host A -> Credential B -> Host B
         """
+        if self._cached_paths is not None and self._cached_paths[0] == self._version:
+            return self._cached_paths[1]
+
         paths = []
-        creds = [n for n, d in self.graph.nodes(data=True) if d["type"] == "credential"]
-        hosts = [n for n, d in self.graph.nodes(data=True) if d["type"] == "host"]
+        by_type = self._collect_by_type()
+        creds = [n for n, d in by_type["credential"]]
+        hosts = [n for n, d in by_type["host"]]
+        if not creds or not hosts:
+            self._cached_paths = (self._version, paths)
+            return paths
+        nodes = self.graph.nodes
 
         for cred in creds:
+            # One BFS per credential covers every host at once
+            parents = self._bfs_parents(cred)
             for host in hosts:
                 # Skip if directly connected (we already know we have access)
                 if self.graph.has_edge(cred, host):
                     continue
-
-                try:
-                    # Find shortest path
-                    path = nx.shortest_path(self.graph, cred, host)
-                    # Only interesting if it involves intermediate steps
-                    if len(path) > 2:
-                        # Convert IDs to Labels for readability
-                        readable_path = []
-                        for node_id in path:
-                            node_data = self.graph.nodes[node_id]
-                            readable_path.append(node_data.get("label", node_id))
-
-                        paths.append(f"Attack Path Found: {' -> '.join(readable_path)}")
-                except nx.NetworkXNoPath:
+                if host not in parents:
                     continue
 
+                # Reconstruct the path back to the credential
+                path = [host]
+                node = host
+                while node != cred:
+                    node = parents[node]
+                    path.append(node)
+                path.reverse()
+
+                # Only interesting if it involves intermediate steps
+                if len(path) > 2:
+                    # Convert IDs to Labels for readability
+                    readable_path = [
+                        nodes[node_id].get("label", node_id) for node_id in path
+                    ]
+                    paths.append(f"Attack Path Found: {' -> '.join(readable_path)}")
+
+        self._cached_paths = (self._version, paths)
         return paths
 
+    def to_bytes(self) -> bytes:
+        """Serialize the graph to a compact JSON snapshot.
+
+        Flat node/edge lists through orjson (stdlib json fallback), which
+        is both faster and smaller than pickling the NetworkX object or
+        going through node_link_data.
+        """
+        return _dumps(
+            {
+                "nodes": [[n, d] for n, d in self.graph.nodes(data=True)],
+                "edges": [[u, v, d] for u, v, d in self.graph.edges(data=True)],
+                "processed_notes": sorted(self._processed_notes),
+            }
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ShadowGraph":
+        """Rebuild a ShadowGraph from a to_bytes() snapshot."""
+        snap = _loads(data)
+        g = cls()
+        nodes = [(sys.intern(n), attrs) for n, attrs in snap.get("nodes", ())]
+        g.graph.add_nodes_from(nodes)
+        g.graph.add_edges_from(
+            (sys.intern(u), sys.intern(v), attrs)
+            for u, v, attrs in snap.get("edges", ())
+        )
+        for node_id, attrs in nodes:
+            g._nodes_by_type[attrs["type"]].append(node_id)
+        g._processed_notes = set(snap.get("processed_notes", ()))
+        if nodes or g.graph.number_of_edges():
+            g._version = 1
+        return g
+
     def to_mermaid(self) -> str:
         """Export graph to Mermaid flowchart format."""
-        lines = ["graph TD"]
-
-        # Add nodes
-        for node, data in self.graph.nodes(data=True):
-            # Sanitize ID for mermaid
-            safe_id = re.sub(r"[^a-zA-Z0-9]", "_", node)
-            label = data.get("label", node).replace('"', "'")
-
-            # Style based on type
-            if data["type"] == "host":
-                lines.append(f'    {safe_id}["🖥️ {label}"]')
-            elif data["type"] == "credential":
-                lines.append(f'    {safe_id}["🔑 {label}"]')
-            elif data["type"] == "vulnerability":
-                lines.append(f'    {safe_id}["⚠️ {label}"]')
-            elif data["type"] == "service":
-                lines.append(f'    {safe_id}["🔌 {label}"]')
-            else:
-                lines.append(f'    {safe_id}["{label}"]')
-
-        # Add edges
-        for u, v, data in self.graph.edges(data=True):
-            safe_u = re.sub(r"[^a-zA-Z0-9]", "_", u)
-            safe_v = re.sub(r"[^a-zA-Z0-9]", "_", v)
-            edge_label = data.get("type", "")
-            lines.append(f"    {safe_u} -->|{edge_label}| {safe_v}")
-
-        return "\n".join(lines)
+        if self._cached_mermaid is not None and self._cached_mermaid[0] == self._version:
+            return self._cached_mermaid[1]
+
+        # Sanitized ids are needed once per node plus twice per edge, so
+        # memoize them for the duration of the export
+        safe_ids: Dict[str, str] = {}
+        sub = _SANITIZE_RE.sub
+
+        def safe(node_id: str) -> str:
+            sid = safe_ids.get(node_id)
+            if sid is None:
+                sid = safe_ids[node_id] = sub("_", node_id)
+            return sid
+
+        prefix = _MERMAID_PREFIX.get
+        nodes = (
+            '    {}["{}{}"]'.format(
+                safe(node),
+                prefix(data["type"], ""),
+                data.get("label", node).replace('"', "'"),
+            )
+            for node, data in self.graph.nodes(data=True)
+        )
+        edges = (
+            f"    {safe(u)} -->|{data.get('type', '')}| {safe(v)}"
+            for u, v, data in self.graph.edges(data=True)
+        )
+        rendered = "\n".join(chain(("graph TD",), nodes, edges))
+        self._cached_mermaid = (self._version, rendered)
+        return rendered
 
     def export_summary(self) -> str:
         """Export a text summary of the graph state."""
+        by_type = self._collect_by_type()
         stats = {
-            "hosts": len(
-                [n for n, d in self.graph.nodes(data=True) if d["type"] == "host"]
-            ),
-            "services": len(
-                [n for n, d in self.graph.nodes(data=True) if d["type"] == "service"]
-            ),
-            "endpoints": len(
-                [n for n, d in self.graph.nodes(data=True) if d["type"] == "endpoint"]
-            ),
-            "technologies": len(
-                [n for n, d in self.graph.nodes(data=True) if d["type"] == "technology"]
-            ),
-            "creds": len(
-                [n for n, d in self.graph.nodes(data=True) if d["type"] == "credential"]
-            ),
-            "vulns": len(
-                [
-                    n
-                    for n, d in self.graph.nodes(data=True)
-                    if d["type"] == "vulnerability"
-                ]
-            ),
+            "hosts": len(by_type["host"]),
+            "services": len(by_type["service"]),
+            "endpoints": len(by_type["endpoint"]),
+            "technologies": len(by_type["technology"]),
+            "creds": len(by_type["credential"]),
+            "vulns": len(by_type["vulnerability"]),
         }
         return f"Graph State: {stats['hosts']} Hosts, {stats['services']} Services, {stats['endpoints']} Endpoints, {stats['technologies']} Technologies, {stats['creds']} Credentials, {stats['vulns']} Vulnerabilities"
@@ -1,15 +1,69 @@
 """RAG (Retrieval Augmented Generation) engine for PentestAgent."""
 
+from __future__ import annotations
+
 import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import numpy as np
-
 from ..workspaces.utils import resolve_knowledge_paths
-from .embeddings import get_embeddings
+
+# numpy and faiss are imported on first use so that importing Document or
+# RAGEngine (e.g. during test collection, or from code paths that never
+# touch embeddings) doesn't pay their load time and RSS
+np = None
+faiss = None
+_faiss_checked = False
+
+
+def _lazy_np():
+    """Bind the module-level `np` on first use and return it."""
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+    return np
+
+
+def _lazy_faiss():
+    """Resolve the optional faiss import (from the "rag" extra) on first use."""
+    global faiss, _faiss_checked
+    if not _faiss_checked:
+        _faiss_checked = True
+        try:
+            import faiss as _faiss
+
+            faiss = _faiss
+        except ImportError:
+            faiss = None
+    return faiss
+
+
+def _normalize_rows(mat: "np.ndarray") -> "np.ndarray":
+    """Return a contiguous float32 copy of `mat` with L2-normalized rows.
+
+    With unit rows, cosine similarity against a unit query collapses to a
+    single matrix-vector product executed by BLAS, instead of recomputing
+    every row norm on each search.
+    """
+    _lazy_np()
+    mat = np.ascontiguousarray(mat, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    np.maximum(norms, 1e-10, out=norms)
+    return mat / norms
+
+
+def _to_storage(mat: np.ndarray) -> np.ndarray:
+    """Normalize rows and downcast to float16 for storage.
+
+    Halves the memory (and on-disk) footprint of the matrix; search is
+    memory-bound, so less DRAM traffic and double the cache residency.
+    The ~1e-3 quantization error is far below the 0.35 score threshold.
+    """
+    return _normalize_rows(mat).astype(np.float16)
 
 
 @dataclass
@@ -50,9 +104,13 @@ class RAGEngine:
         self.embedding_model = embedding_model
         self.use_local_embeddings = use_local_embeddings
         self.documents: List[Document] = []
-        self.embeddings: Optional[np.ndarray] = None
+        # Backing buffer for the embeddings property; may hold spare
+        # capacity so incremental appends don't reallocate per document
+        self._emb_buf: Optional[np.ndarray] = None
+        self._emb_size = 0
         self._indexed = False
         self._source_files: set = set()  # Track unique source files
+        self._faiss_index = None  # lazily built ANN index (when faiss is present)
 
     def index(self, force: bool = False):
         """
@@ -81,7 +139,11 @@ class RAGEngine:
                 emb_dir = kp.get("embeddings")
                 emb_dir.mkdir(parents=True, exist_ok=True)
                 idx_path = emb_dir / "index.pkl"
-                if idx_path.exists() and not force:
+                if (
+                    idx_path.exists()
+                    and not force
+                    and self._index_is_fresh(idx_path, sources_base)
+                ):
                     try:
                         self.load_index(idx_path)
                         return
@@ -159,12 +221,16 @@ class RAGEngine:
         if chunks:
             texts = [doc.content for doc in chunks]
 
-            if self.use_local_embeddings:
-                from .embeddings import get_embeddings_local
-
-                self.embeddings = get_embeddings_local(texts)
-            else:
-                self.embeddings = get_embeddings(texts, model=self.embedding_model)
+            cache_path = None
+            if kp and kp.get("using_workspace"):
+                try:
+                    emb_dir = kp.get("embeddings")
+                    emb_dir.mkdir(parents=True, exist_ok=True)
+                    cache_path = emb_dir / "embed_cache.db"
+                except Exception:
+                    cache_path = None
+            self.embeddings = self._embed_texts_cached(texts, cache_path)
+            self._faiss_index = None
 
             # Store embeddings in documents
             for i, doc in enumerate(self.documents):
@@ -202,6 +268,159 @@ class RAGEngine:
                         "Failed to notify operator about RAG persist error: %s", ne
                     )
 
+    def _index_is_fresh(self, idx_path: Path, sources_base: Path) -> bool:
+        """True when the persisted index is at least as new as every source.
+
+        A stale index (a source file written after the index) is
+        re-embedded instead of loaded, so knowledge edits are picked up
+        without force=True; a fresh one is loaded as a pure mmap and the
+        embedding pass — the expensive step here — is skipped entirely.
+        Stat failures count as stale to stay on the safe side.
+        """
+        try:
+            idx_mtime = idx_path.stat().st_mtime
+            if not sources_base.exists():
+                return True
+            return all(
+                f.stat().st_mtime < idx_mtime
+                for f in sources_base.rglob("*")
+                if f.is_file()
+            )
+        except OSError:
+            return False
+
+    def _embed_texts(self, texts: List[str]) -> "np.ndarray":
+        """Embed `texts` and return them in storage form (unit fp16 rows)."""
+        if self.use_local_embeddings:
+            from .embeddings import get_embeddings_local
+
+            return _to_storage(get_embeddings_local(texts))
+        from .embeddings import get_embeddings
+
+        return _to_storage(get_embeddings(texts, model=self.embedding_model))
+
+    def _embed_texts_cached(
+        self, texts: List[str], cache_path: Optional[Path]
+    ) -> "np.ndarray":
+        """Embed `texts`, serving unchanged chunks from the content cache.
+
+        Entries are keyed by SHA-256 of (model, chunk text), so re-indexing
+        after editing one source file only pays the embedding API for the
+        chunks that actually changed. Any cache failure falls back to a
+        plain full embedding pass.
+        """
+        if cache_path is None:
+            return self._embed_texts(texts)
+        try:
+            from ._embed_cache import EmbedCache, chunk_key
+
+            model = "local" if self.use_local_embeddings else self.embedding_model
+            keys = [chunk_key(model, t) for t in texts]
+            cache = EmbedCache(cache_path)
+            try:
+                hits = cache.get_many(keys)
+                missing = [i for i, k in enumerate(keys) if k not in hits]
+                fresh = None
+                if missing:
+                    fresh = self._embed_texts([texts[i] for i in missing])
+                    cache.put_many(
+                        (keys[i], fresh[j].tobytes()) for j, i in enumerate(missing)
+                    )
+                _lazy_np()
+                dim = (
+                    fresh.shape[1]
+                    if fresh is not None
+                    # Storage rows are fp16: two bytes per dimension
+                    else len(next(iter(hits.values()))) // 2
+                )
+                mat = np.empty((len(texts), dim), dtype=np.float16)
+                j = 0
+                for i, k in enumerate(keys):
+                    blob = hits.get(k)
+                    if blob is not None:
+                        mat[i] = np.frombuffer(blob, dtype=np.float16)
+                    else:
+                        mat[i] = fresh[j]
+                        j += 1
+                return mat
+            finally:
+                cache.close()
+        except Exception as e:
+            logging.getLogger(__name__).exception(
+                "Embedding cache at %s unavailable, embedding all chunks: %s",
+                cache_path,
+                e,
+            )
+            return self._embed_texts(texts)
+
+    @property
+    def embeddings(self) -> Optional[np.ndarray]:
+        """The (n, d) embedding matrix, or None when empty."""
+        if self._emb_size == 0:
+            return None
+        buf = self._emb_buf
+        return buf if buf.shape[0] == self._emb_size else buf[: self._emb_size]
+
+    @embeddings.setter
+    def embeddings(self, value: Optional[np.ndarray]) -> None:
+        self._emb_buf = value
+        self._emb_size = 0 if value is None else value.shape[0]
+
+    def _append_embeddings(self, rows: np.ndarray) -> None:
+        """Append rows to the matrix with geometric growth.
+
+        Doubling the backing buffer makes repeated add_document calls
+        amortized O(1) per row instead of the O(n) copy np.vstack pays
+        every time.
+        """
+        _lazy_np()
+        if self._emb_size == 0:
+            self.embeddings = np.array(rows, copy=True)
+            return
+        buf = self._emb_buf
+        needed = self._emb_size + rows.shape[0]
+        if (
+            needed > buf.shape[0]
+            or buf.dtype != rows.dtype
+            or not buf.flags.writeable  # e.g. a read-only mmap from load_index
+        ):
+            new = np.empty((max(needed, 2 * buf.shape[0]), buf.shape[1]), dtype=rows.dtype)
+            new[: self._emb_size] = buf[: self._emb_size]
+            self._emb_buf = buf = new
+            # Document embeddings are views into the buffer; re-point them
+            # so the old allocation (or mmap) can be released
+            for i, doc in enumerate(self.documents[: self._emb_size]):
+                doc.embedding = buf[i]
+        buf[self._emb_size : needed] = rows
+        self._emb_size = needed
+
+    def _get_faiss_index(self):
+        """Return a FAISS inner-product index over the embeddings, or None.
+
+        Rebuilt lazily after mutations; with unit rows, inner product equals
+        cosine, so FAISS's SIMD kernels give the same scores as the numpy path.
+        """
+        if _lazy_faiss() is None or self.embeddings is None:
+            return None
+        if self._faiss_index is None:
+            index = faiss.IndexFlatIP(self.embeddings.shape[1])
+            index.add(np.ascontiguousarray(self.embeddings, dtype=np.float32))
+            self._faiss_index = index
+        return self._faiss_index
+
+    def _top_k(self, q: np.ndarray, k: int) -> tuple:
+        """Return (indices, scores) of the k best matches, sorted descending."""
+        k = min(k, len(self.documents))
+        index = self._get_faiss_index()
+        if index is not None:
+            scores, ids = index.search(q.reshape(1, -1), k)
+            return ids[0], scores[0]
+        # Upcast for the BLAS product; storage stays fp16
+        similarities = self.embeddings.astype(np.float32) @ q
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(similarities[top])[::-1]]
+        return top, similarities[top]
+
     def _chunk_text(
         self, text: str, source: str, chunk_size: int = 1000, overlap: int = 200
     ) -> List[Document]:
@@ -219,35 +438,40 @@ class RAGEngine:
         """
         chunks = []
 
-        # Split by paragraphs first for better context
-        paragraphs = text.split("\n\n")
-        current_chunk = ""
-
-        for para in paragraphs:
-            if len(current_chunk) + len(para) + 2 <= chunk_size:
-                current_chunk += para + "\n\n"
+        # Split by paragraphs first for better context. Accumulate into a
+        # list and join on emit: O(N) overall instead of quadratic string
+        # concatenation for large files.
+        parts: List[str] = []
+        parts_len = 0  # length of parts joined with "\n\n" separators
+
+        def _flush():
+            nonlocal parts, parts_len
+            content = "\n\n".join(parts).strip()
+            if content:
+                chunks.append(Document(content=content, source=source))
+            parts = []
+            parts_len = 0
+
+        for para in text.split("\n\n"):
+            if parts_len + len(para) + 2 <= chunk_size:
+                parts.append(para)
+                parts_len += len(para) + 2
             else:
-                if current_chunk.strip():
-                    chunks.append(
-                        Document(content=current_chunk.strip(), source=source)
-                    )
-                current_chunk = para + "\n\n"
+                _flush()
+                parts = [para]
+                parts_len = len(para) + 2
 
         # Add the last chunk
-        if current_chunk.strip():
-            chunks.append(Document(content=current_chunk.strip(), source=source))
+        _flush()
 
-        # If no paragraphs were found, fall back to simple chunking
+        # If no paragraphs were found, fall back to simple chunking:
+        # fixed-stride C-level slices with `overlap` characters of overlap
         if not chunks and text.strip():
-            start = 0
-            while start < len(text):
-                end = start + chunk_size
-                chunk = text[start:end]
-
-                if chunk.strip():
-                    chunks.append(Document(content=chunk.strip(), source=source))
-
-                start = end - overlap
+            stride = max(1, chunk_size - overlap)
+            for start in range(0, len(text), stride):
+                chunk = text[start : start + chunk_size].strip()
+                if chunk:
+                    chunks.append(Document(content=chunk, source=source))
 
         return chunks
 
@@ -282,24 +506,17 @@ class RAGEngine:
 
             query_embedding = get_embeddings_local([query])[0]
         else:
+            from .embeddings import get_embeddings
+
             query_embedding = get_embeddings([query], model=self.embedding_model)[0]
 
-        # Compute cosine similarities
-        similarities = np.dot(self.embeddings, query_embedding) / (
-            np.linalg.norm(self.embeddings, axis=1) * np.linalg.norm(query_embedding)
-            + 1e-10
-        )
-
-        # Get top k indices above threshold
-        indices_above_threshold = np.where(similarities >= threshold)[0]
-
-        if len(indices_above_threshold) > 0:
-            # Sort by similarity (descending) and take top k
-            sorted_indices = indices_above_threshold[
-                np.argsort(similarities[indices_above_threshold])[::-1]
-            ]
-            top_indices = sorted_indices[:k]
-        else:
+        # Rows are unit-length at ingest, so cosine is one inner product
+        _lazy_np()
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q = q / (np.linalg.norm(q) + 1e-10)
+        top_indices, top_scores = self._top_k(q, k)
+        top_indices = top_indices[top_scores >= threshold]
+        if len(top_indices) == 0:
             # No results above threshold - return empty rather than irrelevant content
             return []
 
@@ -344,27 +561,26 @@ class RAGEngine:
 
             query_embedding = get_embeddings_local([query])[0]
         else:
-            query_embedding = get_embeddings([query], model=self.embedding_model)[0]
+            from .embeddings import get_embeddings
 
-        # Compute cosine similarities
-        similarities = np.dot(self.embeddings, query_embedding) / (
-            np.linalg.norm(self.embeddings, axis=1) * np.linalg.norm(query_embedding)
-            + 1e-10
-        )
-
-        # Get top k above threshold
-        indices_above_threshold = np.where(similarities >= threshold)[0]
+            query_embedding = get_embeddings([query], model=self.embedding_model)[0]
 
-        if len(indices_above_threshold) > 0:
-            sorted_indices = indices_above_threshold[
-                np.argsort(similarities[indices_above_threshold])[::-1]
-            ]
-            top_indices = sorted_indices[:k]
+        # Rows are unit-length at ingest, so cosine is one inner product
+        _lazy_np()
+        q = np.asarray(query_embedding, dtype=np.float32)
+        q = q / (np.linalg.norm(q) + 1e-10)
+        top_indices, top_scores = self._top_k(q, k)
+        keep = top_scores >= threshold
+        if keep.any():
+            top_indices, top_scores = top_indices[keep], top_scores[keep]
         else:
             # Fallback: return single best result even if below threshold
-            top_indices = [np.argmax(similarities)]
+            top_indices, top_scores = top_indices[:1], top_scores[:1]
 
-        return [(self.documents[i], float(similarities[i])) for i in top_indices]
+        return [
+            (self.documents[i], float(score))
+            for i, score in zip(top_indices, top_scores)
+        ]
 
     def add_document(
         self, content: str, source: str = "user", metadata: Optional[dict] = None
@@ -385,16 +601,18 @@ class RAGEngine:
 
             new_embedding = get_embeddings_local([content])
         else:
+            from .embeddings import get_embeddings
+
             new_embedding = get_embeddings([content], model=self.embedding_model)
 
-        doc.embedding = new_embedding[0]
-        self.documents.append(doc)
+        new_embedding = _to_storage(new_embedding)
 
-        # Update embeddings array
-        if self.embeddings is not None:
-            self.embeddings = np.vstack([self.embeddings, new_embedding])
-        else:
-            self.embeddings = new_embedding
+        # Update embeddings array, then hand the document a view into the
+        # shared buffer rather than a copy of the temporary row
+        self._append_embeddings(new_embedding)
+        doc.embedding = self._emb_buf[self._emb_size - 1]
+        self.documents.append(doc)
+        self._faiss_index = None
 
     def add_documents(self, documents: List[Document]):
         """
@@ -413,16 +631,18 @@ class RAGEngine:
 
             new_embeddings = get_embeddings_local(texts)
         else:
+            from .embeddings import get_embeddings
+
             new_embeddings = get_embeddings(texts, model=self.embedding_model)
 
+        new_embeddings = _to_storage(new_embeddings)
+        self._append_embeddings(new_embeddings)
+        start = self._emb_size - len(documents)
         for i, doc in enumerate(documents):
-            doc.embedding = new_embeddings[i]
+            # View into the shared buffer, not a copy of the temporary row
+            doc.embedding = self._emb_buf[start + i]
             self.documents.append(doc)
-
-        if self.embeddings is not None:
-            self.embeddings = np.vstack([self.embeddings, new_embeddings])
-        else:
-            self.embeddings = new_embeddings
+        self._faiss_index = None
 
     def remove_document(self, doc_id: str) -> bool:
         """
@@ -438,7 +658,13 @@ class RAGEngine:
             if doc.doc_id == doc_id:
                 self.documents.pop(i)
                 if self.embeddings is not None:
+                    _lazy_np()
                     self.embeddings = np.delete(self.embeddings, i, axis=0)
+                    # np.delete allocates a fresh matrix; re-point the
+                    # remaining documents' views at it
+                    for j, remaining in enumerate(self.documents):
+                        remaining.embedding = self._emb_buf[j]
+                self._faiss_index = None
                 return True
         return False
 
@@ -448,6 +674,7 @@ class RAGEngine:
         self.embeddings = None
         self._indexed = False
         self._source_files = set()
+        self._faiss_index = None
 
     def get_document_count(self) -> int:
         """Get the number of source files indexed."""
@@ -462,11 +689,22 @@ class RAGEngine:
         Save the index to disk.
 
         Args:
-            path: Path to save the index
+            path: Path to save the index (a sidecar .npy with the embedding
+                matrix is written next to it; `path` itself holds a JSON
+                manifest with the documents)
         """
-        import pickle
+        path = Path(path)
+        emb_path = path.with_suffix(".npy")
 
-        data = {
+        if self.embeddings is not None:
+            # np.save writes the raw buffer; on load it can be mmapped
+            # instead of deserialized through pickle
+            _lazy_np()
+            np.save(emb_path, np.asarray(self.embeddings))
+
+        manifest = {
+            "format": 1,
+            "embeddings": emb_path.name if self.embeddings is not None else None,
             "documents": [
                 {
                     "content": doc.content,
@@ -476,11 +714,8 @@ class RAGEngine:
                 }
                 for doc in self.documents
             ],
-            "embeddings": self.embeddings,
         }
-
-        with open(path, "wb") as f:
-            pickle.dump(data, f)
+        path.write_text(json.dumps(manifest), encoding="utf-8")
 
     def save_index_to_workspace(self, root: Optional[Path] = None, filename: str = "index.pkl"):
         """
@@ -503,12 +738,36 @@ class RAGEngine:
         Load the index from disk.
 
         Args:
-            path: Path to load the index from
+            path: Path to load the index from (JSON manifest plus .npy
+                sidecar, or a legacy pickle)
         """
-        import pickle
-
-        with open(path, "rb") as f:
-            data = pickle.load(f)
+        path = Path(path)
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            # Legacy pickle index written before the manifest format
+            import pickle
+
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+            manifest = {"documents": data["documents"]}
+            embeddings = data["embeddings"]
+            # Re-normalize so indexes saved before unit-row storage still
+            # search correctly
+            self.embeddings = (
+                _to_storage(embeddings) if embeddings is not None else None
+            )
+        else:
+            emb_name = manifest.get("embeddings")
+            # mmap: startup faults pages lazily during search instead of
+            # deserializing the whole matrix upfront (rows are already
+            # normalized fp16 from save time)
+            _lazy_np()
+            self.embeddings = (
+                np.load(path.parent / emb_name, mmap_mode="r")
+                if emb_name
+                else None
+            )
 
         self.documents = [
             Document(
@@ -517,9 +776,9 @@ class RAGEngine:
                 metadata=d["metadata"],
                 doc_id=d["doc_id"],
             )
-            for d in data["documents"]
+            for d in manifest["documents"]
         ]
-        self.embeddings = data["embeddings"]
+        self._faiss_index = None
 
         # Restore embeddings in documents
         if self.embeddings is not None:
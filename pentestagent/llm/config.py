@@ -1,9 +1,10 @@
 """LLM configuration for PentestAgent."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfig:
     """LLM model configuration."""
 
@@ -24,8 +25,8 @@ class ModelConfig:
     # Timeout
     timeout: int = 120
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for LLM calls."""
+    @cached_property
+    def _generation_params(self) -> dict:
         return {
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
@@ -34,6 +35,14 @@ class ModelConfig:
             "presence_penalty": self.presence_penalty,
         }
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for LLM calls.
+
+        The config is frozen, so the same dict is returned on every call;
+        callers must not mutate it.
+        """
+        return self._generation_params
+
     @classmethod
     def for_model(cls, model: str) -> "ModelConfig":
         """Get configuration for a model. Uses sensible defaults for modern LLMs."""
@@ -27,10 +27,21 @@ Conversation segment:
 
 Provide a concise technical summary:"""
 
+# Template halves precomputed so building a prompt is two concats instead
+# of str.format re-scanning the whole template per chunk
+_SUMMARY_PROMPT_PREFIX, _SUMMARY_PROMPT_SUFFIX = SUMMARY_PROMPT.split("{conversation}")
+
+# Role -> line prefix for summary formatting (tool is handled separately
+# because its prefix includes the tool name)
+_ROLE_PREFIX = {"user": "User: ", "assistant": "Assistant: "}
+
 
 class ConversationMemory:
     """Manages conversation history with token limits and summarization."""
 
+    # Cap on the per-content token count cache (FIFO eviction)
+    _TOKEN_CACHE_MAX = 4096
+
     def __init__(
         self,
         max_tokens: int = 128000,
@@ -54,6 +65,7 @@ class ConversationMemory:
         self._encoder = None
         self._cached_summary: Optional[str] = None
         self._summarized_count: int = 0
+        self._token_cache: dict = {}
 
     @property
     def encoder(self):
@@ -98,20 +110,19 @@ class ConversationMemory:
 
         # If we have a cached summary, prepend it
         if self._cached_summary and len(messages) > self._summarized_count:
-            result = [
-                {
-                    "role": "system",
-                    "content": f"Previous conversation summary:\n{self._cached_summary}",
-                }
-            ]
-            # Add messages after the summarized portion
+            summary_msg = {
+                "role": "system",
+                "content": f"Previous conversation summary:\n{self._cached_summary}",
+            }
+            # Add messages after the summarized portion (single list build,
+            # no extend-triggered regrowth)
             recent = messages[self._summarized_count :]
-            result.extend(
-                self._truncate_to_fit(
-                    recent, self.token_budget - self._count_tokens(result[0])
-                )
-            )
-            return result
+            return [
+                summary_msg,
+                *self._truncate_to_fit(
+                    recent, self.token_budget - self._count_tokens(summary_msg)
+                ),
+            ]
 
         return self._truncate_to_fit(messages, self.token_budget)
 
@@ -131,9 +142,17 @@ class ConversationMemory:
         if not messages:
             return []
 
-        total_tokens = self.get_total_tokens(messages)
         threshold_tokens = int(self.token_budget * self.summarize_threshold)
 
+        # Cheap estimate first (~4 chars per token): when the history is
+        # comfortably under threshold even with a 20% margin, skip the
+        # exact BPE encode entirely
+        approx_tokens = sum(len(c) for c in self._extract_contents(messages)) // 4
+        if approx_tokens * 1.2 < threshold_tokens:
+            return messages
+
+        total_tokens = self.get_total_tokens(messages)
+
         # Check if we need to summarize
         if total_tokens <= threshold_tokens:
             return messages
@@ -144,34 +163,39 @@ class ConversationMemory:
 
         # Split messages: older to summarize, recent to keep
         split_point = len(messages) - self.recent_to_keep
-        older = messages[:split_point]
         recent = messages[-self.recent_to_keep :]
 
         # Check if we already summarized these messages
         if split_point <= self._summarized_count and self._cached_summary:
-            result = [
+            return [
                 {
                     "role": "system",
                     "content": f"Previous conversation summary:\n{self._cached_summary}",
-                }
+                },
+                *recent,
             ]
-            result.extend(recent)
-            return result
-
-        # Summarize older messages
-        summary = await self._summarize(older, llm_call)
 
-        # Cache the summary
-        self._cached_summary = summary
+        # Summarize only the messages not covered by the cached summary, and
+        # append rather than rewrite: keeping the earlier summary text
+        # byte-identical lets provider-side prompt caching keep its prefix
+        # hits across turns (and avoids re-summarizing old messages).
+        new_summary = await self._summarize(
+            messages[self._summarized_count : split_point], llm_call
+        )
+        if self._cached_summary:
+            self._cached_summary = f"{self._cached_summary}\n\n{new_summary}"
+        else:
+            self._cached_summary = new_summary
         self._summarized_count = split_point
 
-        # Build result
-        result = [
-            {"role": "system", "content": f"Previous conversation summary:\n{summary}"}
+        # Build result in one allocation
+        return [
+            {
+                "role": "system",
+                "content": f"Previous conversation summary:\n{self._cached_summary}",
+            },
+            *recent,
         ]
-        result.extend(recent)
-
-        return result
 
     async def _summarize(
         self, messages: List[dict], llm_call: Callable[[str], Awaitable[str]]
@@ -197,7 +221,7 @@ class ConversationMemory:
         for i in range(0, len(messages), chunk_size):
             chunk = messages[i : i + chunk_size]
             conversation_text = self._format_for_summary(chunk)
-            prompt = SUMMARY_PROMPT.format(conversation=conversation_text)
+            prompt = _SUMMARY_PROMPT_PREFIX + conversation_text + _SUMMARY_PROMPT_SUFFIX
 
             try:
                 chunk_summary = await llm_call(prompt)
@@ -227,74 +251,128 @@ class ConversationMemory:
         lines = []
         for msg in messages:
             role = msg.get("role", "unknown")
-            content = msg.get("content", "")
 
-            # Preserve more content for tool outputs (they contain findings)
-            # but still limit to avoid overwhelming the summarizer
-            max_length = 4000 if role == "tool" else 2000
-            if len(content) > max_length:
-                # For tool outputs, try to preserve beginning and end
-                if role == "tool":
-                    half = max_length // 2
+            if role == "tool":
+                content = msg.get("content", "")
+                # Preserve more content for tool outputs (they contain
+                # findings); keep beginning and end when truncating
+                if len(content) > 4000:
                     content = (
-                        content[:half]
-                        + f"\n...[{len(content) - max_length} chars truncated]...\n"
-                        + content[-half:]
+                        content[:2000]
+                        + f"\n...[{len(content) - 4000} chars truncated]...\n"
+                        + content[-2000:]
                     )
-                else:
-                    content = content[:max_length] + "...[truncated]"
-
-            if role == "user":
-                lines.append(f"User: {content}")
-            elif role == "assistant":
-                lines.append(f"Assistant: {content}")
-            elif role == "tool":
                 tool_name = msg.get("name", "tool")
                 lines.append(f"Tool ({tool_name}): {content}")
-            elif role == "system":
-                # Skip system messages in summarization input
                 continue
 
+            # Skip system messages (and unknown roles) in summarization input
+            prefix = _ROLE_PREFIX.get(role)
+            if prefix is None:
+                continue
+
+            content = msg.get("content", "")
+            if len(content) > 2000:
+                content = content[:2000] + "...[truncated]"
+            lines.append(prefix + content)
+
         return "\n\n".join(lines)
 
     def _truncate_to_fit(self, messages: List[dict], budget: int) -> List[dict]:
         """Truncate messages from the beginning to fit budget."""
         total_tokens = 0
         result = []
+        count_tokens = self._count_tokens  # bind once outside the loop
 
         for msg in reversed(messages):
-            msg_tokens = self._count_tokens(msg)
+            msg_tokens = count_tokens(msg)
             if total_tokens + msg_tokens > budget:
                 break
-            result.insert(0, msg)
+            result.append(msg)
             total_tokens += msg_tokens
 
+        result.reverse()
         return result
 
     def _count_tokens(self, message: dict) -> int:
-        """Count tokens in a message."""
+        """Count tokens in a message (memoized by content)."""
         content = message.get("content", "")
 
         if isinstance(content, str):
-            if self.encoder:
-                return len(self.encoder.encode(content))
+            cached = self._token_cache.get(content)
+            if cached is not None:
+                return cached
+
+            encoder = self.encoder  # one property hit, not two
+            if encoder is not None:
+                count = len(encoder.encode(content))
             else:
-                return int(len(content.split()) * 1.3)
+                count = int(len(content.split()) * 1.3)
+
+            self._store_token_count(content, count)
+            return count
 
         return 0
 
+    def _store_token_count(self, content: str, count: int) -> None:
+        """Insert into the token cache, purging FIFO-style at the cap."""
+        if len(self._token_cache) >= self._TOKEN_CACHE_MAX:
+            self._token_cache.pop(next(iter(self._token_cache)))
+        self._token_cache[content] = count
+
+    @staticmethod
+    def _extract_contents(messages: List[dict]) -> List[str]:
+        """Flatten string contents out of the message dicts in one pass.
+
+        The hot loops below then iterate a plain list of strings instead of
+        doing dict lookups per message per pass.
+        """
+        return [c for m in messages if isinstance(c := m.get("content", ""), str)]
+
     def get_total_tokens(self, messages: List[dict]) -> int:
         """Get total token count for messages."""
+        encoder = self.encoder
+        if encoder is not None and hasattr(encoder, "encode_ordinary_batch"):
+            # Batch-encode all uncached contents in one call into tiktoken
+            # instead of paying the FFI boundary per message.
+            cache = self._token_cache
+            total = 0
+            pending: List[str] = []
+            for content in self._extract_contents(messages):
+                cached = cache.get(content)
+                if cached is not None:
+                    total += cached
+                else:
+                    pending.append(content)
+
+            if pending:
+                for content, ids in zip(
+                    pending, encoder.encode_ordinary_batch(pending)
+                ):
+                    count = len(ids)
+                    self._store_token_count(content, count)
+                    total += count
+            return total
+
         return sum(self._count_tokens(msg) for msg in messages)
 
     def fits_in_context(self, messages: List[dict]) -> bool:
         """Check if messages fit in context window."""
-        return self.get_total_tokens(messages) <= self.token_budget
+        # Early exit: stop counting as soon as the budget is exceeded
+        budget = self.token_budget
+        total = 0
+        count_tokens = self._count_tokens
+        for msg in messages:
+            total += count_tokens(msg)
+            if total > budget:
+                return False
+        return True
 
     def clear_summary_cache(self):
         """Clear the cached summary (call when conversation is cleared)."""
         self._cached_summary = None
         self._summarized_count = 0
+        self._token_cache.clear()
 
     def get_stats(self) -> dict:
         """Get memory statistics."""
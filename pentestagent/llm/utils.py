@@ -1,8 +1,30 @@
 """LLM utility functions for PentestAgent."""
 
+import json
+import re
+from functools import lru_cache
 from typing import List, Optional
 
+# Patterns compiled once at import for the extractor functions below
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+_TOOL_CALL_RE = re.compile(r"(?:use|call|execute|run)\s+(\w+)")
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\n?(.*?)```", re.DOTALL)
 
+# Translation table escaping shell metacharacters in one pass
+_SHELL_ESCAPE = str.maketrans(
+    {c: "\\" + c for c in ["`", "$", "\\", '"', "'", ";", "&", "|", ">", "<", "\n", "\r"]}
+)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(name: str = "cl100k_base"):
+    """Load a tiktoken encoding once per process."""
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=4096)
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     Count tokens in text.
@@ -15,14 +37,8 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
         Token count
     """
     try:
-        import tiktoken
-
-        # Select encoding based on model
-        if "gpt-4" in model or "gpt-3.5" in model:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        else:
-            encoding = tiktoken.get_encoding("cl100k_base")
-
+        # All currently supported models use the cl100k_base encoding
+        encoding = _get_encoding("cl100k_base")
         return len(encoding.encode(text))
 
     except ImportError:
@@ -43,9 +59,7 @@ def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4") -> str:
         Truncated text
     """
     try:
-        import tiktoken
-
-        encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = _get_encoding("cl100k_base")
         tokens = encoding.encode(text)
 
         if len(tokens) <= max_tokens:
@@ -110,10 +124,7 @@ def extract_code_blocks(text: str) -> List[dict]:
     Returns:
         List of dicts with 'language' and 'code' keys
     """
-    import re
-
-    pattern = r"```(\w*)\n(.*?)```"
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = _CODE_BLOCK_RE.findall(text)
 
     return [
         {"language": lang or "text", "code": code.strip()} for lang, code in matches
@@ -130,11 +141,8 @@ def extract_tool_calls_from_text(text: str) -> List[dict]:
     Returns:
         List of potential tool calls
     """
-    import re
-
     # Look for patterns like "use tool_name" or "call tool_name"
-    pattern = r"(?:use|call|execute|run)\s+(\w+)"
-    matches = re.findall(pattern, text.lower())
+    matches = _TOOL_CALL_RE.findall(text.lower())
 
     return [{"tool": match} for match in matches]
 
@@ -149,14 +157,8 @@ def sanitize_for_shell(text: str) -> str:
     Returns:
         Sanitized text
     """
-    # Escape dangerous characters
-    dangerous = ["`", "$", "\\", '"', "'", ";", "&", "|", ">", "<", "\n", "\r"]
-
-    result = text
-    for char in dangerous:
-        result = result.replace(char, f"\\{char}")
-
-    return result
+    # Escape dangerous characters in a single translate pass
+    return text.translate(_SHELL_ESCAPE)
 
 
 def parse_llm_json(text: str) -> Optional[dict]:
@@ -169,9 +171,6 @@ def parse_llm_json(text: str) -> Optional[dict]:
     Returns:
         Parsed dict or None
     """
-    import json
-    import re
-
     # Try direct parse first
     try:
         return json.loads(text)
@@ -179,8 +178,7 @@ def parse_llm_json(text: str) -> Optional[dict]:
         pass
 
     # Try to find JSON in code blocks
-    pattern = r"```(?:json)?\n?(.*?)```"
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = _JSON_BLOCK_RE.findall(text)
 
     for match in matches:
         try:
@@ -188,14 +186,22 @@ def parse_llm_json(text: str) -> Optional[dict]:
         except json.JSONDecodeError:
             continue
 
-    # Try to find JSON object in text
-    pattern = r"\{[^{}]*\}"
-    matches = re.findall(pattern, text)
-
-    for match in matches:
-        try:
-            return json.loads(match)
-        except json.JSONDecodeError:
-            continue
+    # Try to find a JSON object in text: single scan tracking brace depth,
+    # attempting a parse whenever a balanced candidate closes. Avoids
+    # materializing every {...} match up front and handles nested objects.
+    depth = 0
+    start = 0
+    for i, ch in enumerate(text):
+        if ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(text[start : i + 1])
+                except json.JSONDecodeError:
+                    continue
 
     return None
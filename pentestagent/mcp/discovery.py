@@ -1,12 +1,31 @@
 """MCP tool discovery for PentestAgent."""
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    # orjson parses bytes directly and is much faster than stdlib json;
+    # fall back transparently when it isn't installed
+    import orjson
 
-@dataclass
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+@dataclass(slots=True)
 class DiscoveredServer:
     """A discovered MCP server."""
 
@@ -16,11 +35,7 @@ class DiscoveredServer:
     command: Optional[str] = None
     args: Optional[List[str]] = None
     url: Optional[str] = None
-    tools: List[dict] = None
-
-    def __post_init__(self):
-        if self.tools is None:
-            self.tools = []
+    tools: List[dict] = field(default_factory=list)
 
 
 class MCPDiscovery:
@@ -51,6 +66,10 @@ class MCPDiscovery:
         },
     ]
 
+    # Memoized results for the static discovery helpers below
+    _cached_local: Optional[List[DiscoveredServer]] = None
+    _cached_default: Optional[Dict[str, Any]] = None
+
     def __init__(self, config_path: Path = Path("mcp.json")):
         """
         Initialize MCP discovery.
@@ -59,6 +78,33 @@ class MCPDiscovery:
             config_path: Path to the MCP configuration file
         """
         self.config_path = config_path
+        # (mtime, parsed config, server-name index) for the last read
+        self._config_cache: Optional[tuple] = None
+
+    def _load_config(self) -> Optional[Dict[str, Any]]:
+        """Load the config file, reusing the cached parse when unchanged."""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+        if self._config_cache is not None and self._config_cache[0] == mtime:
+            return self._config_cache[1]
+
+        try:
+            config = _loads(self.config_path.read_bytes())
+        except json.JSONDecodeError:
+            return None
+
+        names = {s.get("name") for s in config.get("servers", [])}
+        self._config_cache = (mtime, config, names)
+        return config
+
+    def _save_config(self, config: Dict[str, Any]) -> None:
+        """Write the config file and refresh the cache."""
+        self.config_path.write_text(_dumps(config), encoding="utf-8")
+        names = {s.get("name") for s in config.get("servers", [])}
+        self._config_cache = (self.config_path.stat().st_mtime, config, names)
 
     def discover_local(self) -> List[DiscoveredServer]:
         """
@@ -67,16 +113,17 @@ class MCPDiscovery:
         Returns:
             List of discovered servers
         """
-        discovered = []
-
         # Check for npm global packages
         # Check for Python packages
         # This is a simplified implementation
 
-        for server_info in self.KNOWN_SERVERS:
-            discovered.append(DiscoveredServer(**server_info))
+        if MCPDiscovery._cached_local is None:
+            # KNOWN_SERVERS is static, so build the dataclasses once
+            MCPDiscovery._cached_local = [
+                DiscoveredServer(**server_info) for server_info in self.KNOWN_SERVERS
+            ]
 
-        return discovered
+        return MCPDiscovery._cached_local
 
     def load_from_config(self) -> List[Dict[str, Any]]:
         """
@@ -85,14 +132,10 @@ class MCPDiscovery:
         Returns:
             List of server configurations
         """
-        if not self.config_path.exists():
-            return []
-
-        try:
-            config = json.loads(self.config_path.read_text(encoding="utf-8"))
-            return config.get("servers", [])
-        except json.JSONDecodeError:
+        config = self._load_config()
+        if config is None:
             return []
+        return config.get("servers", [])
 
     def add_server_to_config(
         self,
@@ -118,18 +161,17 @@ class MCPDiscovery:
             True if added successfully
         """
         # Load existing config
-        if self.config_path.exists():
-            try:
-                config = json.loads(self.config_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                config = {"servers": []}
-        else:
+        config = self._load_config()
+        if config is None:
             config = {"servers": []}
+        config.setdefault("servers", [])
 
-        # Check if server already exists
-        for existing in config["servers"]:
-            if existing.get("name") == name:
+        # Check if server already exists (O(1) via the cached name index)
+        if self._config_cache is not None and config is self._config_cache[1]:
+            if name in self._config_cache[2]:
                 return False
+        elif any(existing.get("name") == name for existing in config["servers"]):
+            return False
 
         # Build server config
         server_config = {"name": name, "type": server_type, "enabled": True}
@@ -145,7 +187,7 @@ class MCPDiscovery:
         config["servers"].append(server_config)
 
         # Save config
-        self.config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        self._save_config(config)
 
         return True
 
@@ -159,12 +201,8 @@ class MCPDiscovery:
         Returns:
             True if removed successfully
         """
-        if not self.config_path.exists():
-            return False
-
-        try:
-            config = json.loads(self.config_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+        config = self._load_config()
+        if config is None:
             return False
 
         original_count = len(config.get("servers", []))
@@ -175,7 +213,7 @@ class MCPDiscovery:
         if len(config["servers"]) == original_count:
             return False
 
-        self.config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        self._save_config(config)
 
         return True
 
@@ -186,19 +224,25 @@ class MCPDiscovery:
         Returns:
             Default configuration dictionary
         """
-        return {
-            "servers": [
-                {
-                    "name": "filesystem",
-                    "type": "stdio",
-                    "command": "npx",
-                    "args": ["-y", "@modelcontextprotocol/server-filesystem", "/tmp"],
-                    "enabled": True,
-                }
-            ]
-        }
+        if MCPDiscovery._cached_default is None:
+            MCPDiscovery._cached_default = {
+                "servers": [
+                    {
+                        "name": "filesystem",
+                        "type": "stdio",
+                        "command": "npx",
+                        "args": [
+                            "-y",
+                            "@modelcontextprotocol/server-filesystem",
+                            "/tmp",
+                        ],
+                        "enabled": True,
+                    }
+                ]
+            }
+        return MCPDiscovery._cached_default
 
     def save_default_config(self):
         """Save the default configuration to file."""
         config = self.generate_default_config()
-        self.config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        self.config_path.write_text(_dumps(config), encoding="utf-8")
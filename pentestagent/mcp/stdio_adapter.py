@@ -19,6 +19,8 @@ when available and returns response JSON or text.
 """
 from __future__ import annotations
 
+import functools
+import io
 import json
 import os
 import sys
@@ -29,8 +31,56 @@ try:
 except Exception:
     requests = None
 
+try:
+    # orjson encodes straight to compact bytes — several times faster
+    # than stdlib json on the large tool outputs forwarded here
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+# One Session for the adapter's lifetime: keep-alive amortizes the TCP
+# (and TLS) handshake over every forwarded tools/call instead of paying
+# it per request
+if requests is not None:
+    from requests.adapters import HTTPAdapter
+
+    SESSION = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    SESSION.mount("http://", _adapter)
+    SESSION.mount("https://", _adapter)
+    # Verb-to-callable table: one dict lookup per forward; verbs outside
+    # the table fall back to SESSION.request
+    _METHODS = {
+        "GET": SESSION.get,
+        "POST": SESSION.post,
+        "PUT": SESSION.put,
+        "DELETE": SESSION.delete,
+        "PATCH": SESSION.patch,
+    }
+else:
+    SESSION = None
+    _METHODS = {}
+
+# Shared read-only default for params/body kwargs; requests only reads
+# these, so one module-level dict avoids an allocation per forward
+_EMPTY: Dict[str, Any] = {}
+
 
 TARGET = os.environ.get("STDIO_TARGET", "http://127.0.0.1:8888").rstrip("/")
+# Re-validate passthrough JSON bodies before splicing them into a frame
+# (debug aid; costs the parse the passthrough exists to avoid)
+VALIDATE_PASSTHROUGH = os.environ.get("STDIO_VALIDATE_JSON") == "1"
+# Refuse upstream bodies larger than this instead of buffering them all
+MAX_RESPONSE_BYTES = int(os.environ.get("STDIO_MAX_RESPONSE_BYTES", 8 * 1024 * 1024))
 _tools_env = os.environ.get("STDIO_TOOLS")
 def _default_tools() -> List[Dict[str, str]]:
     return [{"name": "http_api", "description": "Generic HTTP proxy"}]
@@ -47,7 +97,7 @@ def _discover_tools_from_target(target: str) -> List[Dict[str, str]]:
         return _default_tools()
     try:
         url = target.rstrip("/") + "/api/tools"
-        r = requests.get(url, timeout=10)
+        r = SESSION.get(url, timeout=10)
         if r.status_code != 200:
             return _default_tools()
         data = r.json()
@@ -76,17 +126,66 @@ def _discover_tools_from_target(target: str) -> List[Dict[str, str]]:
     return _default_tools()
 
 
-if _tools_env:
+@functools.lru_cache(maxsize=8)
+def _parse_tools(env_str: str) -> List[Dict[str, str]]:
+    """Parse a STDIO_TOOLS JSON payload, memoized on the raw string.
+
+    Harnesses that re-import the module with the same environment hit
+    the cache instead of re-parsing; use `_parse_tools.cache_clear()`
+    if the variable is mutated between imports.
+    """
     try:
-        TOOLS: List[Dict[str, str]] = json.loads(_tools_env)
+        return json.loads(env_str)
     except Exception:
-        TOOLS = _default_tools()
+        return _default_tools()
+
+
+if _tools_env:
+    TOOLS: List[Dict[str, str]] = _parse_tools(_tools_env)
 else:
     TOOLS = _discover_tools_from_target(TARGET)
 
+# Hot-path lookups computed once: O(1) tool-name validation and a
+# prebuilt tools/list result instead of rebuilding per request
+_TOOL_NAMES = frozenset(t.get("name") for t in TOOLS if isinstance(t, dict) and t.get("name"))
+_TOOLS_RESULT = {"tools": TOOLS}
+
+# Static response bodies encoded once at import; per call only the id
+# gets serialized and spliced between the prefix and the tail
+_FRAME_PREFIX = b'{"jsonrpc":"2.0","id":'
+_INIT_TAIL = b',"result":{"capabilities":{}}}\n'
+_TOOLS_LIST_TAIL = b',"result":' + _dumps(_TOOLS_RESULT) + b"}\n"
+
+
+# Large enough to drain a burst of frames in one read() syscall
+_READ_BUFFER_SIZE = 131072
+
+# Raw stdout fd, captured once: frames go out via a single write(2) with
+# no TextIOWrapper encoding or buffer-lock overhead. The adapter owns
+# stdout exclusively, so raw-fd atomicity is not a concern. Falls back
+# to the buffered stream when stdout has no real fd (captured/redirected
+# in-process).
+try:
+    _STDOUT_FD: int | None = sys.stdout.fileno()
+except Exception:
+    _STDOUT_FD = None
+
+
+def _write_frame(payload: bytes) -> None:
+    """Write one complete frame (payload must include the newline)."""
+    fd = _STDOUT_FD
+    if fd is None:
+        out = sys.stdout.buffer
+        out.write(payload)
+        out.flush()
+        return
+    n = 0
+    while n < len(payload):
+        n += os.write(fd, payload[n:])
+
 
 def _send(resp: Dict[str, Any]) -> None:
-    print(json.dumps(resp, separators=(",", ":")), flush=True)
+    _write_frame(_dumps(resp) + b"\n")
 
 
 def send_response(req_id: Any, result: Any = None, error: Any = None) -> None:
@@ -99,22 +198,76 @@ def send_response(req_id: Any, result: Any = None, error: Any = None) -> None:
 
 
 def handle_tools_list(req_id: Any) -> None:
-    send_response(req_id, {"tools": TOOLS})
+    _write_frame(_FRAME_PREFIX + _dumps(req_id) + _TOOLS_LIST_TAIL)
+
+
+# Base prefix with the trailing slash applied once, so URL assembly is a
+# single concatenation regardless of how the path is spelled
+_TARGET_SLASH = TARGET + "/"
+
+
+@functools.lru_cache(maxsize=256)
+def _build_url(path: str) -> str:
+    """Assemble the forward URL for `path`, memoized per distinct path."""
+    if path.startswith("http"):
+        return path
+    return _TARGET_SLASH + path.lstrip("/")
+
+
+def _read_body(r: Any) -> bytes:
+    """Drain a streamed response in 64K chunks, enforcing the size cap.
+
+    Streaming lets an oversized body be rejected as soon as the cap is
+    crossed, instead of after the whole transfer has been buffered.
+    """
+    chunks = []
+    total = 0
+    for chunk in r.iter_content(65536):
+        total += len(chunk)
+        if total > MAX_RESPONSE_BYTES:
+            r.close()
+            raise RuntimeError(
+                f"upstream response exceeded {MAX_RESPONSE_BYTES} bytes"
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 def _http_forward(path: str, method: str = "POST", params: Dict[str, Any] | None = None, body: Any | None = None) -> Any:
     if requests is None:
         raise RuntimeError("`requests` not installed in adapter process")
-    url = path if path.startswith("http") else TARGET + (path if path.startswith("/") else "/" + path)
-    method = (method or "POST").upper()
+    url = _build_url(path)
+    method = method.upper() if method else "POST"
     if method == "GET":
-        r = requests.get(url, params=params or {}, timeout=60)
+        r = SESSION.get(url, params=params or _EMPTY, timeout=60, stream=True)
     else:
-        r = requests.request(method, url, json=body or {}, params=params or {}, timeout=300)
+        fn = _METHODS.get(method)
+        if fn is not None:
+            r = fn(url, json=body or _EMPTY, params=params or _EMPTY, timeout=300, stream=True)
+        else:
+            r = SESSION.request(method, url, json=body or _EMPTY, params=params or _EMPTY, timeout=300, stream=True)
+
+    # When upstream already produced a single-line JSON body, hand back
+    # its raw bytes for splicing into the outgoing frame — skipping the
+    # parse-then-reserialize round trip on large tool outputs
+    raw = _read_body(r)
+    if (
+        r.headers.get("content-type", "").startswith("application/json")
+        and raw
+        and b"\n" not in raw
+        and b"\r" not in raw
+    ):
+        if not VALIDATE_PASSTHROUGH:
+            return raw, True
+        try:
+            _loads(raw)
+            return raw, True
+        except Exception:
+            pass
     try:
-        return r.json()
+        return _loads(raw), False
     except Exception:
-        return r.text
+        return raw.decode(r.encoding or "utf-8", "replace"), False
 
 
 def handle_tools_call(req: Dict[str, Any]) -> None:
@@ -124,7 +277,7 @@ def handle_tools_call(req: Dict[str, Any]) -> None:
     arguments = params.get("arguments") or {}
 
     # Validate tool
-    if not any(t.get("name") == name for t in TOOLS):
+    if name not in _TOOL_NAMES:
         send_response(req_id, error=f"unknown tool '{name}'")
         return
 
@@ -138,40 +291,65 @@ def handle_tools_call(req: Dict[str, Any]) -> None:
     qparams = arguments.get("params")
 
     try:
-        content = _http_forward(path, method=method, params=qparams, body=body)
-        send_response(req_id, {"content": content})
+        content, passthrough = _http_forward(path, method=method, params=qparams, body=body)
+        if passthrough:
+            # Splice the upstream JSON bytes into the frame untouched
+            _write_frame(
+                _FRAME_PREFIX
+                + _dumps(req_id)
+                + b',"result":{"content":'
+                + content
+                + b"}}\n"
+            )
+        else:
+            send_response(req_id, {"content": content})
     except Exception as e:
         send_response(req_id, error=str(e))
 
 
+def _on_initialize(req: Dict[str, Any]) -> None:
+    _write_frame(_FRAME_PREFIX + _dumps(req.get("id")) + _INIT_TAIL)
+
+
+def _on_initialized(req: Dict[str, Any]) -> None:
+    # Notification: no response
+    pass
+
+
+def _on_tools_list(req: Dict[str, Any]) -> None:
+    handle_tools_list(req.get("id"))
+
+
+def _on_unknown(req: Dict[str, Any]) -> None:
+    req_id = req.get("id")
+    if req_id is not None:
+        send_response(req_id, error=f"unsupported method '{req.get('method')}'")
+
+
+# One hashed lookup per message instead of an if/elif string cascade;
+# new methods register here without touching the read loop
+HANDLERS = {
+    "initialize": _on_initialize,
+    "notifications/initialized": _on_initialized,
+    "tools/list": _on_tools_list,
+    "tools/call": handle_tools_call,
+}
+
+
 def main() -> None:
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        line = line.strip()
+    # Buffered binary reader: one large read() can serve many frames,
+    # instead of a text-mode readline syscall per message
+    reader = io.BufferedReader(sys.stdin.buffer, buffer_size=_READ_BUFFER_SIZE)
+    for raw in iter(reader.readline, b""):
+        line = raw.strip()
         if not line:
             continue
         try:
-            req = json.loads(line)
+            req = _loads(line)
         except Exception:
             continue
 
-        method = req.get("method")
-        req_id = req.get("id")
-
-        if method == "initialize":
-            send_response(req_id, {"capabilities": {}})
-        elif method == "notifications/initialized":
-            # ignore notification
-            continue
-        elif method == "tools/list":
-            handle_tools_list(req_id)
-        elif method == "tools/call":
-            handle_tools_call(req)
-        else:
-            if req_id is not None:
-                send_response(req_id, error=f"unsupported method '{method}'")
+        HANDLERS.get(req.get("method"), _on_unknown)(req)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,22 @@
 import importlib
-import inspect
 import pkgutil
 from pathlib import Path
 from typing import Dict, Type
 
 from .base_playbook import BasePlaybook
 
-# Registry of available playbooks
+# Registry of available playbooks (populated lazily on first access)
 PLAYBOOKS: Dict[str, Type[BasePlaybook]] = {}
 
+_loaded = False
+
 
 def _discover_playbooks():
-    """Dynamically discover and register playbooks in the current package."""
+    """Import playbook modules; subclasses register themselves on definition.
+
+    Registration happens in BasePlaybook.__init_subclass__, so no class
+    introspection is needed here.
+    """
     package_dir = Path(__file__).parent
 
     # Iterate over all modules in the current package
@@ -21,25 +26,22 @@ def _discover_playbooks():
             continue
 
         try:
-            # Import the module
-            module = importlib.import_module(f".{module_name}", package=__package__)
-
-            # Find all classes in the module that inherit from BasePlaybook
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, BasePlaybook) and obj is not BasePlaybook:
-                    # Register the playbook using its defined name
-                    if hasattr(obj, "name"):
-                        PLAYBOOKS[obj.name] = obj
+            importlib.import_module(f".{module_name}", package=__package__)
         except Exception as e:
             print(f"Error loading playbook module {module_name}: {e}")
 
 
-# Run discovery on import
-_discover_playbooks()
+def _ensure_loaded():
+    """Run discovery on first use rather than at import time."""
+    global _loaded
+    if not _loaded:
+        _discover_playbooks()
+        _loaded = True
 
 
 def get_playbook(name: str) -> BasePlaybook:
     """Get a playbook instance by name."""
+    _ensure_loaded()
     if name not in PLAYBOOKS:
         raise ValueError(
             f"Playbook '{name}' not found. Available: {list(PLAYBOOKS.keys())}"
@@ -49,4 +51,5 @@ def get_playbook(name: str) -> BasePlaybook:
 
 def list_playbooks() -> list[str]:
     """List available playbook names."""
+    _ensure_loaded()
     return list(PLAYBOOKS.keys())
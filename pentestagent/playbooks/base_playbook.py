@@ -18,16 +18,33 @@ class BasePlaybook:
     max_loops: int = 50
     phases: List[Phase] = field(default_factory=list)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Self-register concrete playbooks as soon as the class is defined,
+        # so discovery only has to import the modules
+        name = cls.__dict__.get("name")
+        if name and name != "base_playbook":
+            from . import PLAYBOOKS
+
+            PLAYBOOKS[name] = cls
+
     def get_task(self) -> str:
         """Convert playbook into a structured task description."""
-        task = f"{self.description}\n\n"
+        # Phases are class-level and immutable in practice, so render once
+        # per class (checked via __dict__ so subclasses don't inherit it)
+        cached = type(self).__dict__.get("_rendered_task")
+        if cached is not None:
+            return cached
 
+        parts = [f"{self.description}\n\n"]
         for phase in self.phases:
-            task += f"Phase: {phase.name}\n"
-            task += f"Objective: {phase.objective}\n"
-            task += "Techniques:\n"
+            parts.append(f"Phase: {phase.name}\n")
+            parts.append(f"Objective: {phase.objective}\n")
+            parts.append("Techniques:\n")
             for i, technique in enumerate(phase.techniques, 1):
-                task += f"  {i}. {technique}\n"
-            task += "\n"
+                parts.append(f"  {i}. {technique}\n")
+            parts.append("\n")
 
+        task = "".join(parts)
+        type(self)._rendered_task = task
         return task
@@ -128,13 +128,16 @@ class DockerRuntime(Runtime):
             finally:
                 self.container = None
 
-    async def execute_command(self, command: str, timeout: int = 300) -> CommandResult:
+    async def execute_command(
+        self, command: str, timeout: int = 300, cwd: Optional[str] = None
+    ) -> CommandResult:
         """
         Execute a command in the sandbox.
 
         Args:
             command: The shell command to execute
             timeout: Timeout in seconds
+            cwd: Working directory inside the container
 
         Returns:
             CommandResult with output
@@ -145,7 +148,7 @@ class DockerRuntime(Runtime):
         try:
             # Execute command
             exec_result = self.container.exec_run(
-                cmd=["bash", "-c", command], demux=True
+                cmd=["bash", "-c", command], demux=True, workdir=cwd
             )
 
             stdout = (
@@ -1,12 +1,102 @@
 """Runtime abstraction for PentestAgent."""
 
+import asyncio
+import codecs
+import os
+import signal
 import platform
+import re
 import shutil
+import sys
 import logging
 from abc import ABC, abstractmethod
+from pathlib import Path
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List, Optional
 
+# OS display names by sys.platform; avoids platform.system(), which can
+# shell out to uname on some platforms
+_OS_NAMES = {"win32": "Windows", "darwin": "Darwin", "linux": "Linux"}
+
+# Resource types skipped when an action only needs the DOM, not pixels
+_CONTENT_ONLY_BLOCKED = {"image", "font", "media", "stylesheet"}
+
+# Extraction helpers injected once per context via add_init_script, so V8
+# compiles them once instead of re-parsing the literals on every evaluate
+_PAGE_HELPERS_JS = """
+window.__pa_getLinks = () => Array.from(document.querySelectorAll('a[href]')).map(a => ({
+    href: a.href,
+    text: a.innerText.trim()
+}));
+window.__pa_getForms = () => Array.from(document.querySelectorAll('form')).map(form => ({
+    action: form.action,
+    method: form.method || 'GET',
+    inputs: Array.from(form.querySelectorAll('input, textarea, select')).map(input => ({
+        name: input.name,
+        type: input.type || 'text',
+        value: input.value
+    }))
+}));
+"""
+
+# Regex to strip ANSI escape codes from command output
+_ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+# Default cap on captured bytes per stream for local commands; runaway
+# scan output gets truncated instead of ballooning agent memory
+_MAX_OUTPUT_BYTES = 10 * 1024 * 1024
+
+
+async def _drain_stream(stream, max_bytes: int, process) -> str:
+    """Read a subprocess stream to EOF in chunks, decoding incrementally.
+
+    Output beyond max_bytes is dropped (the stream is still drained so the
+    process doesn't block on a full pipe) and the process tree is
+    terminated.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: List[str] = []
+    remaining = max_bytes
+    truncated = False
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        if truncated:
+            continue
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            truncated = True
+        remaining -= len(chunk)
+        parts.append(decoder.decode(chunk))
+        if truncated:
+            parts.append(f"\n...[output truncated at {max_bytes} bytes]")
+            _terminate_process_tree(process)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _terminate_process_tree(process) -> None:
+    """Terminate a spawned command and its children.
+
+    Commands run via the shell, so terminating just the direct child can
+    orphan grandchildren that keep the output pipes open; signal the whole
+    process group (commands are started in their own session).
+    """
+    if sys.platform == "win32":
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
+        return
+    try:
+        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        try:
+            process.terminate()
+        except ProcessLookupError:
+            pass
+
 if TYPE_CHECKING:
     from ..mcp import MCPManager
 
@@ -241,10 +331,17 @@ class EnvironmentInfo:
     """System environment information."""
 
     os: str  # "Windows", "Linux", "Darwin"
-    os_version: str
     shell: str  # "powershell", "bash", "zsh", etc.
     architecture: str  # "x86_64", "arm64", etc.
     available_tools: List[ToolInfo] = field(default_factory=list)
+    _os_version: Optional[str] = None
+
+    @property
+    def os_version(self) -> str:
+        """OS release string, computed lazily on first access."""
+        if self._os_version is None:
+            self._os_version = platform.release()
+        return self._os_version
 
     def __str__(self) -> str:
         """Concise string representation for prompts."""
@@ -272,10 +369,7 @@ class EnvironmentInfo:
 
 def detect_environment() -> EnvironmentInfo:
     """Detect the current system environment."""
-    import os
-
-    os_name = platform.system()
-    os_version = platform.release()
+    os_name = _OS_NAMES.get(sys.platform, sys.platform)
     arch = platform.machine()
     shell = "unknown"
 
@@ -319,13 +413,26 @@ def detect_environment() -> EnvironmentInfo:
 
     return EnvironmentInfo(
         os=os_name,
-        os_version=os_version,
         shell=shell,
         architecture=arch,
         available_tools=available_tools,
     )
 
 
+# Process-global environment info: immutable once detected, shared by all
+# Runtime instances. Populated on first access rather than at import so
+# that the tool PATH scan is not paid by consumers that never need it.
+_CACHED_ENV: Optional[EnvironmentInfo] = None
+
+
+def get_cached_environment() -> EnvironmentInfo:
+    """Return the process-wide EnvironmentInfo, detecting it on first call."""
+    global _CACHED_ENV
+    if _CACHED_ENV is None:
+        _CACHED_ENV = detect_environment()
+    return _CACHED_ENV
+
+
 @dataclass
 class CommandResult:
     """Result of a command execution."""
@@ -353,8 +460,6 @@ class CommandResult:
 class Runtime(ABC):
     """Abstract base class for runtime environments."""
 
-    _environment: Optional[EnvironmentInfo] = None
-
     def __init__(self, mcp_manager: Optional["MCPManager"] = None):
         """
         Initialize the runtime.
@@ -367,10 +472,8 @@ class Runtime(ABC):
 
     @property
     def environment(self) -> EnvironmentInfo:
-        """Get environment info (cached)."""
-        if Runtime._environment is None:
-            Runtime._environment = detect_environment()
-        return Runtime._environment
+        """Get environment info (cached process-wide)."""
+        return get_cached_environment()
 
     @abstractmethod
     async def start(self):
@@ -383,13 +486,16 @@ class Runtime(ABC):
         pass
 
     @abstractmethod
-    async def execute_command(self, command: str, timeout: int = 300) -> CommandResult:
+    async def execute_command(
+        self, command: str, timeout: int = 300, cwd: Optional[str] = None
+    ) -> CommandResult:
         """
         Execute a shell command.
 
         Args:
             command: The command to execute
             timeout: Timeout in seconds
+            cwd: Working directory for the command
 
         Returns:
             CommandResult with output
@@ -443,6 +549,12 @@ class Runtime(ABC):
 class LocalRuntime(Runtime):
     """Local runtime that executes commands directly on the host."""
 
+    # Optional shared Chromium DevTools endpoint. When a process launcher
+    # starts one Chromium (launch(args=["--remote-debugging-port=0"])) and
+    # publishes its CDP URL here, every LocalRuntime connects to it and
+    # gets its own context instead of paying a full browser launch each.
+    _shared_cdp_url: Optional[str] = None
+
     def __init__(self, mcp_manager: Optional["MCPManager"] = None):
         super().__init__(mcp_manager)
         self._running = False
@@ -451,6 +563,31 @@ class LocalRuntime(Runtime):
         self._page = None
         self._playwright = None
         self._active_processes: list = []
+        self._http_client = None
+        self._page_pool = None
+        # Rotate the browser context every N actions (0 = never) to bound
+        # accumulated page/renderer memory on long sessions
+        self._rotate_every = int(
+            os.environ.get("PENTESTAGENT_BROWSER_ROTATE_ACTIONS", "0") or 0
+        )
+        self._actions_since_rotate = 0
+        # Action name -> bound handler; one dict lookup instead of walking
+        # an if/elif chain per call
+        self._browser_dispatch = {
+            "navigate": self._browser_navigate,
+            "screenshot": self._browser_screenshot,
+            "get_content": self._browser_get_content,
+            "get_links": self._browser_get_links,
+            "get_forms": self._browser_get_forms,
+            "click": self._browser_click,
+            "type": self._browser_type,
+            "execute_js": self._browser_execute_js,
+        }
+        self._proxy_dispatch = {
+            "request": self._proxy_request,
+            "get": self._proxy_get,
+            "post": self._proxy_post,
+        }
 
     async def start(self):
         """Start the local runtime."""
@@ -491,6 +628,14 @@ class LocalRuntime(Runtime):
                     )
         self._active_processes.clear()
 
+        # Clean up the shared HTTP client
+        if self._http_client is not None:
+            try:
+                await self._http_client.aclose()
+            except Exception as e:
+                logging.getLogger(__name__).exception("Failed to close HTTP client: %s", e)
+            self._http_client = None
+
         # Clean up browser
         await self._cleanup_browser()
         self._running = False
@@ -512,6 +657,17 @@ class LocalRuntime(Runtime):
                     )
             self._page = None
 
+        if self._page_pool is not None:
+            while not self._page_pool.empty():
+                pooled_page = self._page_pool.get_nowait()
+                try:
+                    await pooled_page.close()
+                except Exception as e:
+                    logging.getLogger(__name__).debug(
+                        "Failed to close pooled page: %s", e
+                    )
+            self._page_pool = None
+
         if self._browser_context:
             try:
                 await self._browser_context.close()
@@ -569,23 +725,143 @@ class LocalRuntime(Runtime):
             ) from e
 
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=True)
+
+        if self._shared_cdp_url:
+            # Attach to the shared Chromium over CDP with an isolated
+            # context; browser.close() in cleanup only disconnects, so the
+            # shared instance survives this runtime
+            self._browser = await self._playwright.chromium.connect_over_cdp(
+                self._shared_cdp_url
+            )
+            self._browser_context = await self._browser.new_context(
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                ignore_https_errors=True,
+            )
+            await self._browser_context.add_init_script(script=_PAGE_HELPERS_JS)
+            self._page = await self._browser_context.new_page()
+        else:
+            # Persistent context: HTTP cache, cookies and service workers in
+            # the profile dir survive across runs, so repeat visits hit warm
+            # caches. The returned object acts as both browser and context.
+            profile_dir = Path.home() / ".pentestagent" / "browser_profile"
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            self._browser = None
+            self._browser_context = (
+                await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir=str(profile_dir),
+                    headless=True,
+                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                    ignore_https_errors=True,
+                )
+            )
+            await self._browser_context.add_init_script(script=_PAGE_HELPERS_JS)
+            pages = self._browser_context.pages
+            self._page = pages[0] if pages else await self._browser_context.new_page()
+
+        # Small pool of extra pages for stateless URL fetches, so they do
+        # not serialize on (or disturb) the primary stateful page
+        self._page_pool = asyncio.Queue()
+        for _ in range(2):
+            await self._page_pool.put(await self._browser_context.new_page())
+
+    async def snapshot_state(self) -> dict:
+        """Snapshot cookies and localStorage from the active context."""
+        await self._ensure_browser()
+        return await self._browser_context.storage_state()
+
+    async def restore_state(self, state: dict):
+        """Replace the current context with a fresh one seeded from state.
+
+        Only meaningful when attached to a shared browser over CDP; the
+        persistent-context path keeps its state in the profile directory,
+        so a plain rotation (close and relaunch) restores it from disk.
+        """
+        if self._browser is None:
+            raise RuntimeError(
+                "restore_state requires a CDP-attached browser; the "
+                "persistent context restores its state from the profile dir"
+            )
+        await self._close_context_pages()
         self._browser_context = await self._browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            ignore_https_errors=True
+            ignore_https_errors=True,
+            storage_state=state,
         )
+        await self._browser_context.add_init_script(script=_PAGE_HELPERS_JS)
         self._page = await self._browser_context.new_page()
+        self._page_pool = asyncio.Queue()
+        for _ in range(2):
+            await self._page_pool.put(await self._browser_context.new_page())
+        self._actions_since_rotate = 0
 
-    async def execute_command(self, command: str, timeout: int = 300) -> CommandResult:
-        """Execute a command locally."""
-        import asyncio
-        import os
-        import re
-        import subprocess
+    async def _close_context_pages(self):
+        """Close the current pages and context, keeping the browser."""
+        self._page = None
+        if self._page_pool is not None:
+            while not self._page_pool.empty():
+                try:
+                    await self._page_pool.get_nowait().close()
+                except Exception as e:
+                    logging.getLogger(__name__).debug(
+                        "Failed to close pooled page: %s", e
+                    )
+            self._page_pool = None
+        if self._browser_context is not None:
+            try:
+                await self._browser_context.close()
+            except Exception as e:
+                logging.getLogger(__name__).debug(
+                    "Failed to close browser context: %s", e
+                )
+            self._browser_context = None
+
+    async def _rotate_context(self):
+        """Swap in a fresh context, carrying session state across.
+
+        CDP-attached runtimes snapshot storage_state and seed the new
+        context with it; the persistent context is simply closed and
+        relaunched by the next _ensure_browser, restoring cookies and
+        caches from the profile directory. Either way the accumulated
+        renderer memory of the old context is released.
+        """
+        try:
+            if self._browser is not None:
+                state = await self._browser_context.storage_state()
+                await self.restore_state(state)
+            else:
+                await self._cleanup_browser()
+                self._actions_since_rotate = 0
+        except Exception as e:
+            logging.getLogger(__name__).warning(
+                "Browser context rotation failed: %s", e
+            )
+            self._actions_since_rotate = 0
+
+    @staticmethod
+    async def _install_content_only_route(page):
+        """Abort image/font/media/stylesheet requests on this page.
+
+        Content-only actions don't render anything, so skipping these
+        resources cuts bytes fetched and parser work. Callers must unroute
+        after navigation to avoid accumulating handlers on the page.
+        """
+
+        async def handler(route):
+            if route.request.resource_type in _CONTENT_ONLY_BLOCKED:
+                await route.abort()
+            else:
+                await route.continue_()
 
-        # Regex to strip ANSI escape codes
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+        await page.route("**/*", handler)
 
+    async def execute_command(
+        self,
+        command: str,
+        timeout: int = 300,
+        cwd: Optional[str] = None,
+        max_output_bytes: int = _MAX_OUTPUT_BYTES,
+    ) -> CommandResult:
+        """Execute a command locally."""
         # Set environment variables to discourage ANSI output
         env = os.environ.copy()
         env["TERM"] = "dumb"
@@ -596,27 +872,33 @@ class LocalRuntime(Runtime):
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                stdin=subprocess.DEVNULL,  # Prevent interactive prompts
+                stdin=asyncio.subprocess.DEVNULL,  # Prevent interactive prompts
                 env=env,
+                cwd=cwd,
+                # Own session so the whole tree can be signalled on truncation
+                start_new_session=(sys.platform != "win32"),
             )
 
             # Track process for cleanup
             self._active_processes.append(process)
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
+            # Stream both pipes in chunks rather than buffering everything
+            # in communicate(); output past the cap is discarded
+            stdout_str, stderr_str, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _drain_stream(process.stdout, max_output_bytes, process),
+                    _drain_stream(process.stderr, max_output_bytes, process),
+                    process.wait(),
+                ),
+                timeout=timeout,
             )
 
             # Remove from tracking after completion
             if process in self._active_processes:
                 self._active_processes.remove(process)
 
-            # Decode and strip ANSI codes
-            stdout_str = stdout.decode(errors="replace")
-            stderr_str = stderr.decode(errors="replace")
-
-            stdout_clean = ansi_escape.sub("", stdout_str)
-            stderr_clean = ansi_escape.sub("", stderr_str)
+            stdout_clean = _ANSI_ESCAPE_RE.sub("", stdout_str)
+            stderr_clean = _ANSI_ESCAPE_RE.sub("", stderr_str)
 
             return CommandResult(
                 exit_code=process.returncode or 0,
@@ -647,8 +929,6 @@ class LocalRuntime(Runtime):
 
     async def browser_action(self, action: str, **kwargs) -> dict:
         """Perform browser automation actions using Playwright."""
-        import asyncio
-
         # Enforce a hard timeout on the entire operation to prevent hanging
         # Add 5 seconds buffer to the requested timeout for browser startup overhead
         op_timeout = kwargs.get("timeout", 30) + 10
@@ -664,213 +944,281 @@ class LocalRuntime(Runtime):
 
     async def _execute_browser_action(self, action: str, **kwargs) -> dict:
         """Internal execution of browser action."""
+        handler = self._browser_dispatch.get(action)
+        if handler is None:
+            return {"error": f"Unknown browser action: {action}"}
+
+        if (
+            self._rotate_every
+            and self._actions_since_rotate >= self._rotate_every
+            and self._browser_context is not None
+        ):
+            await self._rotate_context()
+
         try:
             await self._ensure_browser()
         except RuntimeError as e:
             return {"error": str(e)}
-
-        timeout = kwargs.get("timeout", 30) * 1000  # Convert to ms
+        self._actions_since_rotate += 1
+
+        # Extract timeout once; remaining kwargs bind directly to the
+        # handler's named parameters, so handlers don't re-probe the dict
+        timeout = kwargs.pop("timeout", 30) * 1000  # Convert to ms
+
+        # Stateless fetches with an explicit URL run on a pooled page so
+        # concurrent calls don't contend on the primary page; stateful
+        # actions keep using the primary page across calls.
+        pooled = (
+            action in ("get_content", "get_links", "get_forms", "screenshot")
+            and kwargs.get("url") is not None
+        )
+        page = await self._page_pool.get() if pooled else self._page
 
         try:
-            if action == "navigate":
-                url = kwargs.get("url")
-                if not url:
-                    return {"error": "URL is required for navigate action"}
+            return await handler(page, timeout, **kwargs)
 
-                await self._page.goto(
-                    url, timeout=timeout, wait_until="domcontentloaded"
-                )
+        except Exception as e:
+            return {"error": f"Browser action failed: {str(e)}"}
 
-                if kwargs.get("wait_for"):
-                    await self._page.wait_for_selector(
-                        kwargs["wait_for"], timeout=timeout
+        finally:
+            if pooled:
+                try:
+                    await page.goto("about:blank")
+                except Exception as e:
+                    logging.getLogger(__name__).debug(
+                        "Failed to reset pooled page: %s", e
                     )
+                self._page_pool.put_nowait(page)
 
-                return {"url": self._page.url, "title": await self._page.title()}
+    async def _goto_for_scrape(self, page, url: str, timeout: int):
+        """Navigate for a content-only action, blocking non-DOM resources."""
+        await self._install_content_only_route(page)
+        try:
+            await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+        finally:
+            await page.unroute("**/*")
 
-            elif action == "screenshot":
-                import time
-                import uuid
+    async def _browser_navigate(
+        self, page, timeout: int, *, url=None, wait_for=None, **_
+    ) -> dict:
+        if not url:
+            return {"error": "URL is required for navigate action"}
 
-                # Navigate first if URL provided
-                if kwargs.get("url"):
-                    await self._page.goto(
-                        kwargs["url"], timeout=timeout, wait_until="domcontentloaded"
-                    )
+        await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
 
-                # Save screenshot to workspace-aware loot/artifacts/screenshots/
-                from ..workspaces.utils import get_loot_file
+        if wait_for:
+            await page.wait_for_selector(wait_for, timeout=timeout)
 
-                output_dir = get_loot_file("artifacts/screenshots").parent
+        return {"url": page.url, "title": await page.title()}
 
-                timestamp = int(time.time())
-                unique_id = uuid.uuid4().hex[:8]
-                filename = f"screenshot_{timestamp}_{unique_id}.png"
-                filepath = output_dir / filename
+    async def _browser_screenshot(
+        self, page, timeout: int, *, url=None, **_
+    ) -> dict:
+        import time
+        import uuid
 
-                await self._page.screenshot(path=str(filepath), full_page=True)
+        # Navigate first if URL provided
+        if url:
+            await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
 
-                return {"path": str(filepath)}
+        # Save screenshot to workspace-aware loot/artifacts/screenshots/
+        from ..workspaces.utils import get_loot_file
 
-            elif action == "get_content":
-                if kwargs.get("url"):
-                    await self._page.goto(
-                        kwargs["url"], timeout=timeout, wait_until="domcontentloaded"
-                    )
+        output_dir = get_loot_file("artifacts/screenshots").parent
 
-                content = await self._page.content()
+        timestamp = int(time.time())
+        unique_id = uuid.uuid4().hex[:8]
+        filename = f"screenshot_{timestamp}_{unique_id}.png"
+        filepath = output_dir / filename
 
-                # Also get text content for easier reading
-                text_content = await self._page.evaluate(
-                    "() => document.body.innerText"
-                )
+        await page.screenshot(path=str(filepath), full_page=True)
 
-                return {
-                    "content": text_content,
-                    "html": content[:10000] if len(content) > 10000 else content,
-                }
+        return {"path": str(filepath)}
 
-            elif action == "get_links":
-                if kwargs.get("url"):
-                    await self._page.goto(
-                        kwargs["url"], timeout=timeout, wait_until="domcontentloaded"
-                    )
+    async def _browser_get_content(
+        self, page, timeout: int, *, url=None, **_
+    ) -> dict:
+        if url:
+            await self._goto_for_scrape(page, url, timeout)
 
-                links = await self._page.evaluate(
-                    """() => {
-                    return Array.from(document.querySelectorAll('a[href]')).map(a => ({
-                        href: a.href,
-                        text: a.innerText.trim()
-                    }));
-                }"""
-                )
+        # One evaluate round-trip for html + text instead of separate
+        # page.content() and innerText calls
+        result = await page.evaluate(
+            """() => ({
+            html: document.documentElement.outerHTML,
+            text: document.body.innerText,
+            title: document.title
+        })"""
+        )
 
-                return {"links": links}
+        content = result["html"]
+        return {
+            "content": result["text"],
+            "title": result["title"],
+            "html": content[:10000] if len(content) > 10000 else content,
+        }
 
-            elif action == "get_forms":
-                if kwargs.get("url"):
-                    await self._page.goto(
-                        kwargs["url"], timeout=timeout, wait_until="domcontentloaded"
-                    )
+    async def _browser_get_links(
+        self, page, timeout: int, *, url=None, **_
+    ) -> dict:
+        if url:
+            await self._goto_for_scrape(page, url, timeout)
 
-                forms = await self._page.evaluate(
-                    """() => {
-                    return Array.from(document.querySelectorAll('form')).map(form => ({
-                        action: form.action,
-                        method: form.method || 'GET',
-                        inputs: Array.from(form.querySelectorAll('input, textarea, select')).map(input => ({
-                            name: input.name,
-                            type: input.type || 'text',
-                            value: input.value
-                        }))
-                    }));
-                }"""
-                )
+        # Helper is compiled once by the init script; a page that was never
+        # navigated (so never ran init scripts) has no links anyway
+        links = await page.evaluate(
+            "() => window.__pa_getLinks ? window.__pa_getLinks() : []"
+        )
 
-                return {"forms": forms}
+        return {"links": links}
 
-            elif action == "click":
-                selector = kwargs.get("selector")
-                if not selector:
-                    return {"error": "Selector is required for click action"}
+    async def _browser_get_forms(
+        self, page, timeout: int, *, url=None, **_
+    ) -> dict:
+        if url:
+            await self._goto_for_scrape(page, url, timeout)
 
-                await self._page.click(selector, timeout=timeout)
-                return {"selector": selector, "clicked": True}
+        forms = await page.evaluate(
+            "() => window.__pa_getForms ? window.__pa_getForms() : []"
+        )
 
-            elif action == "type":
-                selector = kwargs.get("selector")
-                text = kwargs.get("text", "")
-                if not selector:
-                    return {"error": "Selector is required for type action"}
+        return {"forms": forms}
 
-                await self._page.fill(selector, text, timeout=timeout)
-                return {"selector": selector, "typed": True}
+    async def _browser_click(
+        self, page, timeout: int, *, selector=None, **_
+    ) -> dict:
+        if not selector:
+            return {"error": "Selector is required for click action"}
 
-            elif action == "execute_js":
-                javascript = kwargs.get("javascript")
-                if not javascript:
-                    return {"error": "JavaScript code is required"}
+        await page.click(selector, timeout=timeout)
+        return {"selector": selector, "clicked": True}
 
-                result = await self._page.evaluate(javascript)
-                return {"result": str(result) if result else ""}
+    async def _browser_type(
+        self, page, timeout: int, *, selector=None, text="", **_
+    ) -> dict:
+        if not selector:
+            return {"error": "Selector is required for type action"}
 
-            else:
-                return {"error": f"Unknown browser action: {action}"}
+        await page.fill(selector, text, timeout=timeout)
+        return {"selector": selector, "typed": True}
 
-        except Exception as e:
-            return {"error": f"Browser action failed: {str(e)}"}
+    async def _browser_execute_js(
+        self, page, timeout: int, *, javascript=None, **_
+    ) -> dict:
+        if not javascript:
+            return {"error": "JavaScript code is required"}
+
+        result = await page.evaluate(javascript)
+        return {"result": str(result) if result else ""}
+
+    def _ensure_http_client(self):
+        """Create the shared HTTP client on first use.
+
+        A single long-lived client keeps warm keep-alive connections across
+        proxy_action calls instead of paying DNS/TCP/TLS setup per call.
+        """
+        if self._http_client is None:
+            import httpx
+
+            self._http_client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32, keepalive_expiry=60
+                ),
+            )
+        return self._http_client
 
     async def proxy_action(self, action: str, **kwargs) -> dict:
         """HTTP proxy actions using httpx."""
+        handler = self._proxy_dispatch.get(action)
+        if handler is None:
+            return {"error": f"Unknown proxy action: {action}"}
+
         try:
-            import httpx
+            client = self._ensure_http_client()
         except ImportError:
             return {"error": "httpx not installed. Install with: pip install httpx"}
 
         timeout = kwargs.get("timeout", 30)
 
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout, follow_redirects=True
-            ) as client:
-                if action == "request":
-                    method = kwargs.get("method", "GET").upper()
-                    url = kwargs.get("url")
-                    headers = kwargs.get("headers", {})
-                    data = kwargs.get("data")
-
-                    if not url:
-                        return {"error": "URL is required"}
-
-                    response = await client.request(
-                        method, url, headers=headers, data=data
-                    )
-
-                    return {
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "body": (
-                            response.text[:10000]
-                            if len(response.text) > 10000
-                            else response.text
-                        ),
-                    }
-
-                elif action == "get":
-                    url = kwargs.get("url")
-                    if not url:
-                        return {"error": "URL is required"}
-
-                    response = await client.get(url, headers=kwargs.get("headers", {}))
-                    return {
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "body": response.text[:10000],
-                    }
-
-                elif action == "post":
-                    url = kwargs.get("url")
-                    if not url:
-                        return {"error": "URL is required"}
-
-                    response = await client.post(
-                        url,
-                        headers=kwargs.get("headers", {}),
-                        data=kwargs.get("data"),
-                        json=kwargs.get("json"),
-                    )
-                    return {
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "body": response.text[:10000],
-                    }
-
-                else:
-                    return {"error": f"Unknown proxy action: {action}"}
+            return await handler(client, timeout, **kwargs)
 
         except Exception as e:
             return {"error": f"Proxy action failed: {str(e)}"}
 
+    @staticmethod
+    def _decode_body(raw: bytes, encoding: Optional[str], limit: int = 10000) -> str:
+        """Decode at most limit bytes of a response body.
+
+        response.text would decode the entire body before truncation;
+        slicing the raw bytes first keeps decode work bounded for
+        multi-megabyte responses. A character split at the boundary is
+        absorbed by errors="replace".
+        """
+        return raw[:limit].decode(encoding or "utf-8", errors="replace")
+
+    async def _proxy_request(self, client, timeout: int, **kwargs) -> dict:
+        method = kwargs.get("method", "GET").upper()
+        url = kwargs.get("url")
+        headers = kwargs.get("headers", {})
+        data = kwargs.get("data")
+
+        if not url:
+            return {"error": "URL is required"}
+
+        # Stream the body and stop pulling once the truncation limit is
+        # reached, so a multi-megabyte response costs 10KB of transfer and
+        # decode instead of being fully buffered then sliced
+        async with client.stream(
+            method, url, headers=headers, data=data, timeout=timeout
+        ) as response:
+            chunks = []
+            total = 0
+            async for chunk in response.aiter_bytes(8192):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= 10000:
+                    break
+
+            return {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "body": self._decode_body(b"".join(chunks), response.encoding),
+            }
+
+    async def _proxy_get(self, client, timeout: int, **kwargs) -> dict:
+        url = kwargs.get("url")
+        if not url:
+            return {"error": "URL is required"}
+
+        response = await client.get(
+            url, headers=kwargs.get("headers", {}), timeout=timeout
+        )
+        return {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "body": self._decode_body(response.content, response.encoding),
+        }
+
+    async def _proxy_post(self, client, timeout: int, **kwargs) -> dict:
+        url = kwargs.get("url")
+        if not url:
+            return {"error": "URL is required"}
+
+        response = await client.post(
+            url,
+            headers=kwargs.get("headers", {}),
+            data=kwargs.get("data"),
+            json=kwargs.get("json"),
+            timeout=timeout,
+        )
+        return {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "body": self._decode_body(response.content, response.encoding),
+        }
+
     async def is_running(self) -> bool:
         return self._running
 
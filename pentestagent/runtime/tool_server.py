@@ -3,7 +3,48 @@
 import asyncio
 import json
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+try:
+    # orjson serializes straight to bytes and parses bytes directly, which
+    # suits the binary frame format; fall back when it isn't installed
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Wire format: 4-byte little-endian payload length, then the JSON payload.
+# readexactly() on a known length avoids byte-by-byte newline scanning and
+# lets a whole request/response arrive in one read.
+
+
+def _write_frame(writer: asyncio.StreamWriter, payload: dict) -> None:
+    """Serialize and write one length-prefixed frame (caller drains)."""
+    buf = _dumps(payload)
+    writer.write(len(buf).to_bytes(4, "little") + buf)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Optional[dict]:
+    """Read one length-prefixed frame, or None on clean EOF."""
+    try:
+        header = await reader.readexactly(4)
+    except asyncio.IncompleteReadError:
+        return None
+    length = int.from_bytes(header, "little")
+    data = await reader.readexactly(length)
+    return _loads(data)
 
 
 @dataclass
@@ -78,45 +119,94 @@ class ToolServer:
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ):
         """Handle an incoming connection."""
+        write_lock = asyncio.Lock()
+        tasks: set = set()
         try:
             while self._running:
                 # Read request
-                data = await reader.readline()
-                if not data:
-                    break
-
                 try:
-                    request_data = json.loads(data.decode())
-                    request = ToolRequest(
-                        tool_name=request_data["tool"],
-                        arguments=request_data.get("arguments", {}),
-                        request_id=request_data.get("id", "unknown"),
-                    )
-
-                    # Execute tool
-                    response = await self._execute_tool(request)
-
-                    # Send response
-                    response_data = {
-                        "id": response.request_id,
-                        "result": response.result,
-                        "error": response.error,
-                        "success": response.success,
-                    }
-                    writer.write((json.dumps(response_data) + "\n").encode())
+                    request_data = await _read_frame(reader)
+                except ValueError:
+                    _write_frame(writer, {"error": "Invalid JSON", "success": False})
                     await writer.drain()
+                    continue
+                if request_data is None:
+                    break
 
-                except json.JSONDecodeError:
-                    error_response = {"error": "Invalid JSON", "success": False}
-                    writer.write((json.dumps(error_response) + "\n").encode())
-                    await writer.drain()
+                # Execute each frame in its own task so pipelined clients
+                # get concurrent execution; responses carry the request id,
+                # so completion order doesn't matter. A list frame is a
+                # batch: its requests run concurrently and come back as one
+                # list frame.
+                if isinstance(request_data, list):
+                    coro = self._execute_batch_and_respond(
+                        [self._request_from_dict(r) for r in request_data],
+                        writer,
+                        write_lock,
+                    )
+                else:
+                    coro = self._execute_and_respond(
+                        self._request_from_dict(request_data), writer, write_lock
+                    )
+                task = asyncio.create_task(coro)
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
 
         except Exception as e:
             print(f"Connection error: {e}")
         finally:
+            for task in tasks:
+                task.cancel()
             writer.close()
             await writer.wait_closed()
 
+    @staticmethod
+    def _request_from_dict(data: dict) -> ToolRequest:
+        """Build a ToolRequest from a decoded wire payload."""
+        return ToolRequest(
+            tool_name=data["tool"],
+            arguments=data.get("arguments", {}),
+            request_id=data.get("id", "unknown"),
+        )
+
+    @staticmethod
+    def _response_payload(response: ToolResponse) -> dict:
+        """Build the wire payload for a response."""
+        return {
+            "id": response.request_id,
+            "result": response.result,
+            "error": response.error,
+            "success": response.success,
+        }
+
+    async def _execute_and_respond(
+        self,
+        request: ToolRequest,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ):
+        """Run one request and write its framed response."""
+        response = await self._execute_tool(request)
+        async with write_lock:
+            _write_frame(writer, self._response_payload(response))
+            await writer.drain()
+
+    async def _execute_batch_and_respond(
+        self,
+        requests: list,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ):
+        """Run a batch concurrently and write one framed list response."""
+        responses = await asyncio.gather(
+            *(self._execute_tool(request) for request in requests)
+        )
+        async with write_lock:
+            _write_frame(
+                writer, [self._response_payload(r) for r in responses]
+            )
+            await writer.drain()
+
     async def _execute_tool(self, request: ToolRequest) -> ToolResponse:
         """Execute a tool request."""
         handler = self._tools.get(request.tool_name)
@@ -142,6 +232,9 @@ class ToolServer:
 class ToolClient:
     """Client for communicating with the tool server in the sandbox."""
 
+    # Debounce window for coalescing concurrent call_tool()s into one frame
+    _BATCH_WINDOW = 0.001
+
     def __init__(self, host: str = "localhost", port: int = 9999):
         """
         Initialize the tool client.
@@ -155,18 +248,106 @@ class ToolClient:
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._request_id = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._outbox: list = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def connect(self):
         """Connect to the tool server."""
         self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        # One background task dispatches responses to their callers, so
+        # multiple call_tool()s can be in flight on the same connection
+        self._reader_task = asyncio.create_task(self._read_loop())
 
     async def disconnect(self):
         """Disconnect from the tool server."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._outbox.clear()
         if self._writer:
             self._writer.close()
             await self._writer.wait_closed()
             self._writer = None
             self._reader = None
+        self._fail_pending(ConnectionError("Disconnected from tool server"))
+
+    def _fail_pending(self, exc: Exception):
+        """Fail all in-flight requests with the given exception."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _read_loop(self):
+        """Read framed responses and resolve the matching pending future."""
+        try:
+            while True:
+                response = await _read_frame(self._reader)
+                if response is None:
+                    self._fail_pending(
+                        ConnectionError("Tool server closed the connection")
+                    )
+                    break
+                if isinstance(response, list):
+                    for entry in response:
+                        self._dispatch_response(entry)
+                else:
+                    self._dispatch_response(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail_pending(e)
+
+    def _dispatch_response(self, response: dict):
+        """Resolve the pending future matching one response payload."""
+        future = self._pending.pop(response.get("id"), None)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def _enqueue(self, tool_name: str, arguments: dict):
+        """Queue one request, returning (request_id, future)."""
+        self._request_id += 1
+        request_id = str(self._request_id)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._outbox.append(
+            {"id": request_id, "tool": tool_name, "arguments": arguments}
+        )
+        return request_id, future
+
+    async def _flush_outbox(self):
+        """Flush queued requests as one frame after a short debounce.
+
+        Concurrent call_tool()s landing within the window share a single
+        frame (and server-side batch), amortizing framing and syscall
+        overhead; a lone request still goes out as a plain dict frame.
+        """
+        await asyncio.sleep(self._BATCH_WINDOW)
+        # Keep draining until the outbox stays empty: a request enqueued
+        # while drain() is suspended on backpressure lands in the fresh
+        # outbox and would otherwise sit unwritten until the next
+        # call_tool spawns a flusher
+        while self._outbox:
+            if not self._writer:
+                return
+            batch, self._outbox = self._outbox, []
+            _write_frame(self._writer, batch[0] if len(batch) == 1 else batch)
+            await self._writer.drain()
+
+    @staticmethod
+    def _response_from_dict(response: dict, request_id: str) -> ToolResponse:
+        """Build a ToolResponse from a decoded wire payload."""
+        return ToolResponse(
+            request_id=response.get("id", request_id),
+            result=response.get("result"),
+            error=response.get("error"),
+            success=response.get("success", False),
+        )
 
     async def call_tool(self, tool_name: str, arguments: dict) -> ToolResponse:
         """
@@ -182,21 +363,47 @@ class ToolClient:
         if not self._writer or not self._reader:
             raise RuntimeError("Not connected to tool server")
 
-        self._request_id += 1
-        request_id = str(self._request_id)
+        request_id, future = self._enqueue(tool_name, arguments)
+
+        # The response is dispatched to us by _read_loop, so concurrent
+        # calls overlap on the wire instead of serializing
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_outbox())
+
+        try:
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
 
-        # Send request
-        request = {"id": request_id, "tool": tool_name, "arguments": arguments}
-        self._writer.write((json.dumps(request) + "\n").encode())
+        return self._response_from_dict(response, request_id)
+
+    async def call_tool_batched(self, calls: list) -> list:
+        """
+        Call several tools in one frame.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs
+
+        Returns:
+            List of ToolResponse in call order
+        """
+        if not self._writer or not self._reader:
+            raise RuntimeError("Not connected to tool server")
+        if not calls:
+            return []
+
+        entries = [self._enqueue(tool_name, args) for tool_name, args in calls]
+        batch, self._outbox = self._outbox, []
+        _write_frame(self._writer, batch if len(batch) > 1 else batch[0])
         await self._writer.drain()
 
-        # Read response
-        response_data = await self._reader.readline()
-        response = json.loads(response_data.decode())
+        try:
+            responses = await asyncio.gather(*(future for _, future in entries))
+        finally:
+            for request_id, _ in entries:
+                self._pending.pop(request_id, None)
 
-        return ToolResponse(
-            request_id=response.get("id", request_id),
-            result=response.get("result"),
-            error=response.get("error"),
-            success=response.get("success", False),
-        )
+        return [
+            self._response_from_dict(response, request_id)
+            for response, (request_id, _) in zip(responses, entries)
+        ]
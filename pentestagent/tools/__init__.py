@@ -8,16 +8,51 @@ from .registry import (
     clear_tools,
     disable_tool,
     enable_tool,
-    get_all_tools,
-    get_tool,
-    get_tool_names,
-    get_tools_by_category,
     register_tool,
     register_tool_instance,
 )
+from .registry import get_all_tools as _registry_get_all_tools
+from .registry import get_tool as _registry_get_tool
+from .registry import get_tool_names as _registry_get_tool_names
+from .registry import get_tools_by_category as _registry_get_tools_by_category
+
+# Built-in tools are loaded lazily on first registry access, so consumers
+# that only need Tool/ToolSchema don't pay for discovering and importing
+# every tool module at import time
+_loaded = False
+
+
+def _ensure_loaded():
+    """Run tool discovery on first use rather than at import time."""
+    global _loaded
+    if not _loaded:
+        load_all_tools()
+        _loaded = True
+
+
+def get_all_tools(*args, **kwargs):
+    """Get all registered tools (loads built-in tools on first call)."""
+    _ensure_loaded()
+    return _registry_get_all_tools(*args, **kwargs)
+
+
+def get_tool(*args, **kwargs):
+    """Get a tool by name (loads built-in tools on first call)."""
+    _ensure_loaded()
+    return _registry_get_tool(*args, **kwargs)
+
+
+def get_tool_names(*args, **kwargs):
+    """Get all registered tool names (loads built-in tools on first call)."""
+    _ensure_loaded()
+    return _registry_get_tool_names(*args, **kwargs)
+
+
+def get_tools_by_category(*args, **kwargs):
+    """Get tools in a category (loads built-in tools on first call)."""
+    _ensure_loaded()
+    return _registry_get_tools_by_category(*args, **kwargs)
 
-# Auto-load all built-in tools on import
-_loaded = load_all_tools()
 
 __all__ = [
     # Registry
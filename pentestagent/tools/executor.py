@@ -1,7 +1,10 @@
 """Tool executor for PentestAgent."""
 
 import asyncio
-from dataclasses import dataclass
+import json
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -10,7 +13,10 @@ if TYPE_CHECKING:
     from .registry import Tool
 
 
-@dataclass
+# slots=True: results are allocated once per tool call and retained in
+# bulk (history, cache); dropping the per-instance __dict__ shrinks them
+# and cheapens GC traversal under heavy batches
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of a tool execution."""
 
@@ -19,6 +25,8 @@ class ExecutionResult:
     result: Optional[str] = None
     error: Optional[str] = None
     success: bool = True
+    # Wall-clock timestamps are optional; duration_ms is measured with the
+    # monotonic perf counter and is the authoritative timing
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     duration_ms: float = 0.0
@@ -32,7 +40,17 @@ class ExecutionResult:
 class ToolExecutor:
     """Handles tool execution with error handling and logging."""
 
-    def __init__(self, runtime: "Runtime", timeout: int = 300, max_retries: int = 0):
+    def __init__(
+        self,
+        runtime: "Runtime",
+        timeout: int = 300,
+        max_retries: int = 0,
+        cache_ttl: float = 300.0,
+        cache_max: int = 128,
+        max_parallel: int = 16,
+        eager: bool = True,
+        history_max: int = 1000,
+    ):
         """
         Initialize the tool executor.
 
@@ -40,11 +58,39 @@ class ToolExecutor:
             runtime: The runtime environment
             timeout: Default timeout for tool execution in seconds
             max_retries: Number of retries on failure
+            cache_ttl: Default lifetime for cached results of cacheable tools
+            cache_max: Maximum number of cached results (LRU eviction)
+            max_parallel: Cap on concurrently running batch executions
+            eager: Start batch tasks eagerly on Python 3.12+ so calls that
+                finish without real I/O (cache hits, validation failures)
+                skip the event-loop round-trip
+            history_max: Number of recent results retained in
+                execution_history (older entries are dropped; stats keep
+                counting all executions)
         """
         self.runtime = runtime
         self.timeout = timeout
         self.max_retries = max_retries
-        self.execution_history: List[ExecutionResult] = []
+        # Bounded so long sessions don't grow memory without limit; the
+        # running aggregates below cover everything ever executed
+        self.execution_history: "deque[ExecutionResult]" = deque(maxlen=history_max)
+        self._n_ok = 0
+        self._n_fail = 0
+        self._sum_duration_ms = 0.0
+        self._tools_used: Counter = Counter()
+        # (tool_name, canonical args) -> (expires_at, ExecutionResult) for
+        # tools that declare themselves cacheable
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_max = cache_max
+        # Bounds batch concurrency so a large batch doesn't spawn hundreds
+        # of subprocesses/connections at once; single execute() calls are
+        # deliberately unguarded to keep non-batch latency untouched
+        self._batch_sem = asyncio.Semaphore(max_parallel)
+        self._eager = eager
+        # In-flight executions keyed like the cache, so concurrent identical
+        # calls collapse onto one real execution (single-flight)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
 
     async def execute(
         self, tool: "Tool", arguments: dict, timeout: Optional[int] = None
@@ -61,7 +107,9 @@ class ToolExecutor:
             ExecutionResult with the outcome
         """
         execution_timeout = timeout or self.timeout
-        start_time = datetime.now()
+        # Monotonic ns counter: cheaper than datetime.now() and immune to
+        # wall-clock adjustments; called twice per execution on a hot path
+        t0 = time.perf_counter_ns()
 
         # Validate arguments
         is_valid, error_msg = tool.validate_arguments(arguments)
@@ -71,14 +119,66 @@ class ToolExecutor:
                 arguments=arguments,
                 error=error_msg,
                 success=False,
-                start_time=start_time,
-                end_time=datetime.now(),
+                duration_ms=(time.perf_counter_ns() - t0) / 1e6,
             )
-            result.duration_ms = (result.end_time - start_time).total_seconds() * 1000
-            self.execution_history.append(result)
+            self._record(result)
             return result
 
-        # Execute with retries
+        key = None
+        if tool.cacheable or tool.singleflight:
+            key = (
+                tool.name,
+                json.dumps(arguments, sort_keys=True, separators=(",", ":")),
+            )
+
+        # Serve repeat calls of pure tools from the result cache
+        cache_key = key if tool.cacheable else None
+        if cache_key is not None:
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                result = replace(
+                    cached, duration_ms=(time.perf_counter_ns() - t0) / 1e6
+                )
+                self._record(result)
+                return result
+
+        # Single-flight: if an identical call is already running, await its
+        # result instead of executing the tool a second time
+        flight: Optional[asyncio.Future] = None
+        if tool.singleflight and key is not None:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                primary = await asyncio.shield(existing)
+                result = replace(
+                    primary, duration_ms=(time.perf_counter_ns() - t0) / 1e6
+                )
+                self._record(result)
+                return result
+            flight = asyncio.get_running_loop().create_future()
+            self._inflight[key] = flight
+
+        try:
+            result = await self._run_with_retries(
+                tool, arguments, execution_timeout, t0, cache_key
+            )
+            if flight is not None:
+                flight.set_result(result)
+            return result
+        finally:
+            if flight is not None:
+                self._inflight.pop(key, None)
+                if not flight.done():
+                    flight.cancel()
+
+    async def _run_with_retries(
+        self,
+        tool: "Tool",
+        arguments: dict,
+        execution_timeout: int,
+        t0: int,
+        cache_key: Optional[tuple],
+    ) -> ExecutionResult:
+        """Run the tool with the configured retry policy."""
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
@@ -87,17 +187,16 @@ class ToolExecutor:
                     tool.execute(arguments, self.runtime), timeout=execution_timeout
                 )
 
-                end_time = datetime.now()
                 result = ExecutionResult(
                     tool_name=tool.name,
                     arguments=arguments,
                     result=output,
                     success=True,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration_ms=(end_time - start_time).total_seconds() * 1000,
+                    duration_ms=(time.perf_counter_ns() - t0) / 1e6,
                 )
-                self.execution_history.append(result)
+                self._record(result)
+                if cache_key is not None:
+                    self._cache_store(cache_key, result, tool.cache_ttl)
                 return result
 
             except asyncio.TimeoutError:
@@ -110,19 +209,85 @@ class ToolExecutor:
                 await asyncio.sleep(1)
 
         # All attempts failed
-        end_time = datetime.now()
         result = ExecutionResult(
             tool_name=tool.name,
             arguments=arguments,
             error=last_error,
             success=False,
-            start_time=start_time,
-            end_time=end_time,
-            duration_ms=(end_time - start_time).total_seconds() * 1000,
+            duration_ms=(time.perf_counter_ns() - t0) / 1e6,
         )
+        self._record(result)
+        return result
+
+    def _record(self, result: ExecutionResult) -> None:
+        """Append a result to history and fold it into the running stats."""
         self.execution_history.append(result)
+        if result.success:
+            self._n_ok += 1
+        else:
+            self._n_fail += 1
+        self._sum_duration_ms += result.duration_ms
+        self._tools_used[result.tool_name] += 1
+
+    def _cache_lookup(self, key: tuple) -> Optional[ExecutionResult]:
+        """Return a fresh cached result for key, or None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
         return result
 
+    def _cache_store(self, key: tuple, result: ExecutionResult, ttl: Optional[float]):
+        """Cache a successful result, evicting the LRU entry at capacity."""
+        if len(self._cache) >= self._cache_max:
+            self._cache.popitem(last=False)
+        self._cache[key] = (time.monotonic() + (ttl or self._cache_ttl), result)
+
+    def clear_cache(self):
+        """Drop all cached tool results."""
+        self._cache.clear()
+
+    async def execute_batch_iter(self, executions: List[tuple["Tool", dict]]):
+        """
+        Execute tools in parallel, yielding each result as it completes.
+
+        Unlike execute_batch, results arrive in completion order: callers
+        can log, summarize or feed fast results onward while the slowest
+        tools are still running instead of blocking on the whole batch.
+
+        Args:
+            executions: List of (tool, arguments) tuples
+
+        Yields:
+            ExecutionResult per execution, fastest first
+        """
+        spawn = self._spawn
+        tasks = [spawn(self._execute_guarded(tool, args)) for tool, args in executions]
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+
+    def _spawn(self, coro) -> "asyncio.Future":
+        """Schedule a batch coroutine, eagerly where the runtime allows.
+
+        With the eager task factory (3.12+), coroutines that never block —
+        cache hits and argument-validation failures — complete inside this
+        call and never touch the scheduler.
+        """
+        if self._eager and hasattr(asyncio, "eager_task_factory"):
+            return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+        return asyncio.ensure_future(coro)
+
+    async def _execute_guarded(
+        self, tool: "Tool", arguments: dict, timeout: Optional[int] = None
+    ) -> ExecutionResult:
+        """Run one execution under the batch concurrency limit."""
+        async with self._batch_sem:
+            return await self.execute(tool, arguments, timeout)
+
     async def execute_batch(
         self, executions: List[tuple["Tool", dict]], parallel: bool = False
     ) -> List[ExecutionResult]:
@@ -134,10 +299,13 @@ class ToolExecutor:
             parallel: Whether to execute in parallel
 
         Returns:
-            List of ExecutionResults
+            List of ExecutionResults, in input order
         """
         if parallel:
-            tasks = [self.execute(tool, args) for tool, args in executions]
+            spawn = self._spawn
+            tasks = [
+                spawn(self._execute_guarded(tool, args)) for tool, args in executions
+            ]
             return await asyncio.gather(*tasks)
         else:
             results = []
@@ -153,41 +321,25 @@ class ToolExecutor:
         Returns:
             Dictionary with execution statistics
         """
-        if not self.execution_history:
-            return {
-                "total_executions": 0,
-                "successful": 0,
-                "failed": 0,
-                "success_rate": 0.0,
-                "avg_duration_ms": 0.0,
-                "tools_used": {},
-            }
-
-        total = len(self.execution_history)
-        successful = sum(1 for r in self.execution_history if r.success)
-        failed = total - successful
-
-        # Calculate average duration
-        durations = [r.duration_ms for r in self.execution_history]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
-
-        # Count tool usage
-        tools_used: Dict[str, int] = {}
-        for result in self.execution_history:
-            tools_used[result.tool_name] = tools_used.get(result.tool_name, 0) + 1
-
+        # Served from running aggregates (O(1)) rather than rescanning
+        # history, which is bounded and may have dropped old entries
+        total = self._n_ok + self._n_fail
         return {
             "total_executions": total,
-            "successful": successful,
-            "failed": failed,
-            "success_rate": successful / total if total > 0 else 0.0,
-            "avg_duration_ms": avg_duration,
-            "tools_used": tools_used,
+            "successful": self._n_ok,
+            "failed": self._n_fail,
+            "success_rate": self._n_ok / total if total > 0 else 0.0,
+            "avg_duration_ms": self._sum_duration_ms / total if total > 0 else 0.0,
+            "tools_used": dict(self._tools_used),
         }
 
     def clear_history(self):
-        """Clear the execution history."""
+        """Clear the execution history and its aggregates."""
         self.execution_history.clear()
+        self._n_ok = 0
+        self._n_fail = 0
+        self._sum_duration_ms = 0.0
+        self._tools_used.clear()
 
     def get_last_result(
         self, tool_name: Optional[str] = None
@@ -228,7 +228,9 @@ class CompletionReport:
 
 def is_task_complete(result: str) -> bool:
     """Check if a tool result signals task completion."""
-    return result.startswith(TASK_COMPLETE_SIGNAL)
+    # Called on every tool result; almost none start with "_", so reject on
+    # the first character before comparing the full sentinel
+    return result[:1] == "_" and result.startswith(TASK_COMPLETE_SIGNAL)
 
 
 def extract_completion_summary(result: str) -> str:
@@ -2,25 +2,24 @@
 
 import importlib
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from .registry import get_all_tools
 
+# Module names that imported successfully; lets load_tool_module
+# short-circuit without probing sys.modules on repeat loads
+_loaded_ok: set = set()
+# Fully-qualified names this loader put into sys.modules (including
+# submodules pulled in by a tool package); reload_tools evicts exactly
+# these instead of prefix-scanning all of sys.modules
+_loaded_modules: set = set()
 
-def discover_tools(tools_dir: Optional[Path] = None) -> List[str]:
-    """
-    Discover all tool modules in the tools directory.
-
-    Args:
-        tools_dir: Path to tools directory. Defaults to package tools dir.
-
-    Returns:
-        List of discovered tool module names
-    """
-    if tools_dir is None:
-        tools_dir = Path(__file__).parent
 
+@lru_cache(maxsize=8)
+def _discover_tools_cached(tools_dir: Path) -> tuple:
+    """Scan a tools directory once; repeat calls are a dict lookup."""
     discovered = []
 
     for item in tools_dir.iterdir():
@@ -36,7 +35,23 @@ def discover_tools(tools_dir: Optional[Path] = None) -> List[str]:
         elif item.suffix == ".py":
             discovered.append(item.stem)
 
-    return discovered
+    return tuple(discovered)
+
+
+def discover_tools(tools_dir: Optional[Path] = None) -> List[str]:
+    """
+    Discover all tool modules in the tools directory.
+
+    Args:
+        tools_dir: Path to tools directory. Defaults to package tools dir.
+
+    Returns:
+        List of discovered tool module names
+    """
+    if tools_dir is None:
+        tools_dir = Path(__file__).parent
+
+    return list(_discover_tools_cached(tools_dir.resolve()))
 
 
 def load_tool_module(module_name: str, tools_dir: Optional[Path] = None) -> bool:
@@ -53,16 +68,31 @@ def load_tool_module(module_name: str, tools_dir: Optional[Path] = None) -> bool
     if tools_dir is None:
         tools_dir = Path(__file__).parent
 
+    # Fast path for modules this loader already imported successfully
+    if module_name in _loaded_ok:
+        return True
+
     try:
         # Build the full module path
         full_module_name = f"pentestagent.tools.{module_name}"
 
         # Check if already loaded
         if full_module_name in sys.modules:
+            _loaded_ok.add(module_name)
+            _loaded_modules.add(full_module_name)
             return True
 
-        # Try to import the module
+        # Try to import the module, noting which tool modules the import
+        # added (packages may pull in their own submodules)
+        before = set(sys.modules)
         importlib.import_module(full_module_name)
+        _loaded_modules.update(
+            name
+            for name in sys.modules.keys() - before
+            if name.startswith("pentestagent.tools.")
+        )
+        _loaded_modules.add(full_module_name)
+        _loaded_ok.add(module_name)
         return True
 
     except ImportError as e:
@@ -122,22 +152,15 @@ def reload_tools():
     # Clear existing tools
     clear_tools()
 
-    # Unload tool modules from sys.modules
-    to_remove = [
-        name
-        for name in sys.modules
-        if name.startswith("pentestagent.tools.")
-        and name
-        not in (
-            "pentestagent.tools",
-            "pentestagent.tools.registry",
-            "pentestagent.tools.executor",
-            "pentestagent.tools.loader",
-        )
-    ]
+    # Unload the modules this loader imported (O(loaded tools), not a
+    # prefix scan over all of sys.modules)
+    for name in list(_loaded_modules):
+        sys.modules.pop(name, None)
+    _loaded_modules.clear()
 
-    for name in to_remove:
-        del sys.modules[name]
+    # Drop memoized discovery/import state so modules are rescanned
+    _discover_tools_cached.cache_clear()
+    _loaded_ok.clear()
 
     # Reload all tools
     return load_all_tools()
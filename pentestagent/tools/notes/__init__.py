@@ -1,20 +1,59 @@
 """Notes tool for PentestAgent - persistent key findings storage."""
 
 import asyncio
+import io
 import json
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from ..registry import ToolSchema, register_tool
 
+try:
+    # orjson parses and serializes dict-of-dict payloads several times
+    # faster than the stdlib; fall back when it isn't installed
+    import orjson
+
+    def _loads(s: str) -> Any:
+        return orjson.loads(s)
+
+    def _dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _loads(s: str) -> Any:
+        return json.loads(s)
+
+    def _dumps_compact(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _dumps_indent(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
 # Notes storage - kept at loot root for easy access
 _notes: Dict[str, Dict[str, Any]] = {}
+# Secondary index: category -> note keys, kept in sync on every mutation
+# so the list action doesn't regroup the whole store on each TUI refresh
+_notes_by_category: Dict[str, set] = defaultdict(set)
 # Optional override (tests can call set_notes_file)
 _custom_notes_file: Path | None = None
 # Lock for safe concurrent access from multiple agents (asyncio since agents are async tasks)
 _notes_lock = asyncio.Lock()
 
 
+# Mutations are appended to a JSONL op log next to the snapshot; the log
+# is folded back into the snapshot after this many ops, keeping writes
+# O(1) per mutation instead of rewriting the whole file each time
+_COMPACT_THRESHOLD = 256
+_ops_since_compact = 0
+
+
 def _notes_file_path() -> Path:
     from ...workspaces.utils import get_loot_file
 
@@ -23,66 +62,143 @@ def _notes_file_path() -> Path:
     return get_loot_file("notes.json")
 
 
-def _load_notes_unlocked() -> None:
-    """Load notes from file (caller must hold lock)."""
-    global _notes
+def _log_file_path() -> Path:
+    nf = _notes_file_path()
+    return nf.parent / (nf.name + ".log")
+
+
+def _read_notes_from_disk() -> Dict[str, Dict[str, Any]]:
+    """Read the snapshot and replay the op log (pure, no globals)."""
+    notes: Dict[str, Dict[str, Any]] = {}
+
     nf = _notes_file_path()
     if nf.exists():
         try:
-            loaded = json.loads(nf.read_text(encoding="utf-8"))
-            # Migration: Convert legacy string values to dicts
-            _notes = {}
-            for k, v in loaded.items():
-                if isinstance(v, str):
-                    _notes[k] = {
-                        "content": v,
-                        "category": "info",
-                        "confidence": "medium",
-                    }
-                else:
-                    _notes[k] = v
-        except (json.JSONDecodeError, IOError):
-            _notes = {}
+            loaded = _loads(nf.read_text(encoding="utf-8"))
+        except (ValueError, IOError):
+            loaded = {}
+        # Migration: Convert legacy string values to dicts
+        for k, v in loaded.items():
+            if isinstance(v, str):
+                notes[k] = {
+                    "content": v,
+                    "category": "info",
+                    "confidence": "medium",
+                }
+            else:
+                notes[k] = v
+
+    lf = _log_file_path()
+    if lf.exists():
+        try:
+            lines = lf.read_text(encoding="utf-8").splitlines()
+        except IOError:
+            lines = []
+        for line in lines:
+            try:
+                op = _loads(line)
+            except ValueError:
+                continue  # torn write at the tail; ignore
+            if op.get("op") == "put":
+                notes[op["k"]] = op["v"]
+            elif op.get("op") == "del":
+                notes.pop(op.get("k"), None)
+
+    return notes
+
+
+def _load_notes_unlocked() -> None:
+    """Load notes from file (caller must hold lock)."""
+    global _notes
+    _notes = _read_notes_from_disk()
+    _rebuild_category_index()
+
+
+def _rebuild_category_index() -> None:
+    """Recompute the category index from _notes."""
+    _notes_by_category.clear()
+    for k, v in _notes.items():
+        _notes_by_category[v.get("category", "info")].add(k)
+
+
+def _index_discard(key: str) -> None:
+    """Drop a note key from the category index."""
+    note = _notes.get(key)
+    if note is None:
+        return
+    cat = note.get("category", "info")
+    keys = _notes_by_category.get(cat)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _notes_by_category[cat]
+
+
+def _append_line(path: Path, line: str) -> None:
+    """Blocking single-line append (runs in a worker thread)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(line)
+
+
+async def _append_op(op: Dict[str, Any]) -> None:
+    """Record one mutation in the op log (caller must hold lock).
+
+    A single-line append instead of rewriting the whole notes file; the
+    log is compacted into the snapshot once it grows past the threshold.
+    The actual file writes run in a worker thread so a slow disk stalls
+    only this note operation, not the whole event loop. Holding the notes
+    lock across the write keeps op order and snapshot consistency.
+    """
+    global _ops_since_compact
+    line = _dumps_compact(op) + "\n"
+    await asyncio.to_thread(_append_line, _log_file_path(), line)
+    _ops_since_compact += 1
+    if _ops_since_compact >= _COMPACT_THRESHOLD:
+        await asyncio.to_thread(_save_notes_unlocked)
 
 
 def _save_notes_unlocked() -> None:
-    """Save notes to file (caller must hold lock)."""
+    """Write the canonical snapshot and truncate the op log (caller must hold lock)."""
+    global _ops_since_compact
     nf = _notes_file_path()
     nf.parent.mkdir(parents=True, exist_ok=True)
-    nf.write_text(json.dumps(_notes, indent=2), encoding="utf-8")
+    nf.write_text(_dumps_indent(_notes), encoding="utf-8")
+    _log_file_path().unlink(missing_ok=True)
+    _ops_since_compact = 0
 
 
 async def get_all_notes() -> Dict[str, Dict[str, Any]]:
     """Get all notes (for TUI /notes command)."""
     async with _notes_lock:
         if not _notes:
-            _load_notes_unlocked()
+            # First access may hit disk; keep the event loop free
+            await asyncio.to_thread(_load_notes_unlocked)
         return _notes.copy()
 
 
 def get_all_notes_sync() -> Dict[str, Dict[str, Any]]:
     """Get all notes synchronously (read-only, best effort for prompts)."""
-    # If notes are empty, try to load from disk (safe read)
-    if not _notes and _notes_file_path().exists():
-        try:
-            loaded = json.loads(_notes_file_path().read_text(encoding="utf-8"))
-            # Migration for sync read
-            result = {}
-            for k, v in loaded.items():
-                if isinstance(v, str):
-                    result[k] = {
-                        "content": v,
-                        "category": "info",
-                        "confidence": "medium",
-                    }
-                else:
-                    result[k] = v
-            return result
-        except (json.JSONDecodeError, IOError):
-            pass
+    # If notes are empty, try to load from disk (safe read); notes may
+    # live only in the op log before the first compaction
+    if not _notes and (_notes_file_path().exists() or _log_file_path().exists()):
+        return _read_notes_from_disk()
     return _notes.copy()
 
 
+def get_all_notes_view() -> Mapping[str, Dict[str, Any]]:
+    """Get a read-only live view of all notes (no copy).
+
+    Prompt builders and renderers iterate the notes on every request; a
+    MappingProxyType avoids the O(N) dict copy that get_all_notes_sync
+    pays for caller isolation. The view tracks later mutations — callers
+    that need a stable snapshot should use the copying variants.
+    """
+    if not _notes and (_notes_file_path().exists() or _log_file_path().exists()):
+        _load_notes_unlocked()
+    return MappingProxyType(_notes)
+
+
 def set_notes_file(path: Path) -> None:
     """Set custom notes file path."""
     global _custom_notes_file
@@ -347,7 +463,8 @@ async def notes(arguments: dict, runtime) -> str:
                 "status": status,
                 "metadata": metadata,
             }
-            _save_notes_unlocked()
+            _notes_by_category[category].add(key)
+            await _append_op({"op": "put", "k": key, "v": _notes[key]})
             return f"Created note '{key}' ({category}, {status})"
 
         elif action == "read":
@@ -358,7 +475,7 @@ async def notes(arguments: dict, runtime) -> str:
 
             note = _notes[key]
             meta_str = (
-                f" {json.dumps(note.get('metadata', {}))}"
+                f" {_dumps_compact(note.get('metadata', {}))}"
                 if note.get("metadata")
                 else ""
             )
@@ -379,6 +496,7 @@ async def notes(arguments: dict, runtime) -> str:
                 return validation_error
 
             # Merge metadata if updating? For now, overwrite to keep it simple and consistent with content
+            _index_discard(key)  # category may change on update
             _notes[key] = {
                 "content": value,
                 "category": category,
@@ -386,7 +504,8 @@ async def notes(arguments: dict, runtime) -> str:
                 "status": status,
                 "metadata": metadata,
             }
-            _save_notes_unlocked()
+            _notes_by_category[category].add(key)
+            await _append_op({"op": "put", "k": key, "v": _notes[key]})
             return f"{'Updated' if existed else 'Created'} note '{key}'"
 
         elif action == "delete":
@@ -395,35 +514,30 @@ async def notes(arguments: dict, runtime) -> str:
             if key not in _notes:
                 return f"Note '{key}' not found"
 
+            _index_discard(key)
             del _notes[key]
-            _save_notes_unlocked()
+            await _append_op({"op": "del", "k": key})
             return f"Deleted note '{key}'"
 
         elif action == "list":
             if not _notes:
                 return "No notes saved"
 
-            lines = [f"Notes ({len(_notes)} entries):"]
-
-            # Group by category for display
-            by_category = {}
-            for k, v in _notes.items():
-                cat = v["category"]
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append((k, v))
-
-            for cat in sorted(by_category.keys()):
-                lines.append(f"\n## {cat.title()}")
-                for k, v in by_category[cat]:
+            # One growing buffer instead of a list of per-line strings;
+            # grouping comes straight off the maintained index
+            buf = io.StringIO()
+            buf.write(f"Notes ({len(_notes)} entries):")
+            for cat in sorted(_notes_by_category.keys()):
+                buf.write(f"\n\n## {cat.title()}")
+                for k in sorted(_notes_by_category[cat]):
+                    v = _notes[k]
                     content = v["content"]
-                    display_val = (
-                        content if len(content) <= 60 else content[:57] + "..."
-                    )
+                    if len(content) > 60:
+                        content = content[:57] + "..."
                     conf = v.get("confidence", "medium")
-                    lines.append(f"  [{k}] ({conf}) {display_val}")
+                    buf.write(f"\n  [{k}] ({conf}) {content}")
 
-            return "\n".join(lines)
+            return buf.getvalue()
 
         else:
             return f"Unknown action: {action}"
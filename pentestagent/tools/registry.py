@@ -1,13 +1,30 @@
 """Tool registry for PentestAgent."""
 
+import json
+import sys
 from dataclasses import dataclass, field
-from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from ..runtime import Runtime
 
 
+def _always_valid(arguments: dict) -> tuple[bool, Optional[str]]:
+    """Shared validator for tools with nothing to check."""
+    return True, None
+
+
+# JSON Schema type name -> Python type(s) for argument validation
+_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
 @dataclass
 class ToolSchema:
     """JSON Schema for tool parameters."""
@@ -42,6 +59,62 @@ class Tool:
     category: str = "general"
     enabled: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Pure tools (same arguments -> same result) may opt in to executor-side
+    # result caching; cache_ttl of None uses the executor's default
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    # Idempotent tools may opt in to letting concurrent identical calls
+    # share one execution; defaults off because most tools have side
+    # effects (e.g. two identical terminal commands must both run)
+    singleflight: bool = False
+
+    def __post_init__(self):
+        # Tools are immutable after registration, so the LLM wire format
+        # (and its JSON form) can be built once instead of per request.
+        # This also covers instances built directly via Tool(...), e.g.
+        # MCP tools going through register_tool_instance.
+        self._llm_format = {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": {
+                    "type": self.schema.type,
+                    "properties": self.schema.properties or {},
+                    "required": self.schema.required or [],
+                },
+            },
+        }
+        self._llm_format_json = json.dumps(self._llm_format)
+
+        # Compile the schema into a validator closure once, rather than
+        # re-walking required/properties on every call: the required names
+        # and (key, type) checks become constants in the closure cells
+        required = tuple(self.schema.required or ())
+        typed = tuple(
+            (key, prop["type"], _TYPE_MAP[prop["type"]])
+            for key, prop in (self.schema.properties or {}).items()
+            if prop.get("type") in _TYPE_MAP
+        )
+
+        # Nothing to check: share one module-level no-op instead of
+        # allocating a closure that loops over empty tuples per call
+        if not required and not typed:
+            self.validate_arguments = _always_valid
+            return
+
+        def _validate(
+            arguments: dict, _required=required, _typed=typed
+        ) -> tuple[bool, Optional[str]]:
+            for name in _required:
+                if name not in arguments:
+                    return False, f"Missing required field: {name}"
+            for key, type_name, expected in _typed:
+                if key in arguments and not isinstance(arguments[key], expected):
+                    return False, f"Invalid type for {key}: expected {type_name}"
+            return True, None
+
+        self.validate_arguments = _validate
 
     async def execute(self, arguments: dict, runtime: "Runtime") -> str:
         """
@@ -60,19 +133,12 @@ class Tool:
         return await self.execute_fn(arguments, runtime)
 
     def to_llm_format(self) -> dict:
-        """Convert to LLM function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": {
-                    "type": self.schema.type,
-                    "properties": self.schema.properties or {},
-                    "required": self.schema.required or [],
-                },
-            },
-        }
+        """Convert to LLM function calling format (cached; do not mutate)."""
+        return self._llm_format
+
+    def to_llm_format_json(self) -> str:
+        """The LLM function calling format pre-serialized as JSON."""
+        return self._llm_format_json
 
     def validate_arguments(self, arguments: dict) -> tuple[bool, Optional[str]]:
         """
@@ -84,40 +150,9 @@ class Tool:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check required fields
-        for required_field in self.schema.required or []:
-            if required_field not in arguments:
-                return False, f"Missing required field: {required_field}"
-
-        # Type checking (basic)
-        for key, value in arguments.items():
-            if key in (self.schema.properties or {}):
-                expected_type = self.schema.properties[key].get("type")
-                if expected_type:
-                    if not self._check_type(value, expected_type):
-                        return (
-                            False,
-                            f"Invalid type for {key}: expected {expected_type}",
-                        )
-
-        return True, None
-
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """Check if a value matches the expected type."""
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
-        expected = type_map.get(expected_type)
-        if expected is None:
-            return True  # Unknown type, allow
-
-        return isinstance(value, expected)
+        # Replaced per instance by the compiled closure in __post_init__;
+        # kept as documentation of the contract
+        raise NotImplementedError
 
 
 # Global tool registry
@@ -125,7 +160,13 @@ _tools: Dict[str, Tool] = {}
 
 
 def register_tool(
-    name: str, description: str, schema: ToolSchema, category: str = "general"
+    name: str,
+    description: str,
+    schema: ToolSchema,
+    category: str = "general",
+    cacheable: bool = False,
+    cache_ttl: Optional[float] = None,
+    singleflight: bool = False,
 ) -> Callable:
     """
     Decorator to register a tool.
@@ -135,25 +176,29 @@ def register_tool(
         description: Description of what the tool does
         schema: The parameter schema
         category: Tool category for organization
+        cacheable: Whether identical calls may return a cached result
+        cache_ttl: Cache lifetime in seconds (None = executor default)
+        singleflight: Whether concurrent identical calls share one execution
 
     Returns:
         Decorator function
     """
 
     def decorator(fn: Callable) -> Callable:
-        @wraps(fn)
-        async def wrapper(arguments: dict, runtime: "Runtime") -> str:
-            return await fn(arguments, runtime)
-
+        # Register the coroutine function directly: a pass-through async
+        # wrapper would cost an extra coroutine frame on every call
         tool = Tool(
-            name=name,
+            name=sys.intern(name),
             description=description,
             schema=schema,
-            execute_fn=wrapper,
+            execute_fn=fn,
             category=category,
+            cacheable=cacheable,
+            cache_ttl=cache_ttl,
+            singleflight=singleflight,
         )
-        _tools[name] = tool
-        return wrapper
+        _tools[tool.name] = tool
+        return fn
 
     return decorator
 
@@ -165,7 +210,9 @@ def get_all_tools() -> List[Tool]:
 
 def get_tool(name: str) -> Optional[Tool]:
     """Get a tool by name."""
-    return _tools.get(name)
+    # Names are interned at registration; interning the probe makes the
+    # dict lookup an identity compare for names decoded off the wire
+    return _tools.get(sys.intern(name))
 
 
 def register_tool_instance(tool: Tool) -> None:
@@ -175,6 +222,7 @@ def register_tool_instance(tool: Tool) -> None:
     Args:
         tool: The Tool instance to register
     """
+    tool.name = sys.intern(tool.name)
     _tools[tool.name] = tool
 
 
@@ -45,12 +45,7 @@ async def terminal(arguments: dict, runtime: "Runtime") -> str:
     command = arguments["command"]
     timeout = arguments.get("timeout", 300)
     working_dir = arguments.get("working_dir")
-
-    # Build the full command with working directory if specified
-    if working_dir:
-        full_command = f"cd {working_dir} && {command}"
-    else:
-        full_command = command
+    full_command = command
 
     # If the provided command appears to be flags-only (starts with '-')
     # it's likely the LLM intended to call a specific tool (e.g. `nmap`)
@@ -58,9 +53,9 @@ async def terminal(arguments: dict, runtime: "Runtime") -> str:
     # the `nmap` binary when available in the runtime environment.
     try:
         cmd_prefix = ""
-        cmd_rest = full_command
-        if "&&" in full_command:
-            left, right = full_command.split("&&", 1)
+        cmd_rest = command
+        if "&&" in command:
+            left, right = command.split("&&", 1)
             cmd_prefix = left + "&& "
             cmd_rest = right
 
@@ -114,23 +109,23 @@ async def terminal(arguments: dict, runtime: "Runtime") -> str:
         # Best-effort; do not fail if introspection errors occur
         pass
 
-    result = await runtime.execute_command(full_command, timeout=timeout)
-
-    # Format the output
-    output_parts = [f"Command: {command}"]
-
-    if working_dir:
-        output_parts.append(f"Working Directory: {working_dir}")
-
-    output_parts.append(f"Exit Code: {result.exit_code}")
-
-    if result.stdout:
-        output_parts.append(f"\n--- stdout ---\n{result.stdout}")
-
-    if result.stderr:
-        output_parts.append(f"\n--- stderr ---\n{result.stderr}")
-
-    if not result.stdout and not result.stderr:
-        output_parts.append("\n(No output)")
-
-    return "\n".join(output_parts)
+    # Pass the working directory to the runtime instead of composing a
+    # "cd X && ..." shell prefix (faster, and no quoting pitfalls)
+    result = await runtime.execute_command(
+        full_command, timeout=timeout, cwd=working_dir
+    )
+
+    # Format the output: one sequence literal instead of append-by-append,
+    # since this runs on every tool call
+    stdout = result.stdout
+    stderr = result.stderr
+    return "\n".join(
+        (
+            f"Command: {command}",
+            *((f"Working Directory: {working_dir}",) if working_dir else ()),
+            f"Exit Code: {result.exit_code}",
+            *((f"\n--- stdout ---\n{stdout}",) if stdout else ()),
+            *((f"\n--- stderr ---\n{stderr}",) if stderr else ()),
+            *(("\n(No output)",) if not stdout and not stderr else ()),
+        )
+    )
@@ -1,7 +1,11 @@
 """Web search tool for PentestAgent."""
 
+import asyncio
+import atexit
 import os
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
 import httpx
 
@@ -10,6 +14,44 @@ from ..registry import ToolSchema, register_tool
 if TYPE_CHECKING:
     from ...runtime import Runtime
 
+# Shared client so repeat searches reuse the TLS connection to the API
+# instead of paying the full handshake per call
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+# Normalized query -> (expires_at, formatted result). The executor cache
+# keys on the exact argument JSON; normalizing here also catches queries
+# that differ only in case or surrounding whitespace.
+_search_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_SEARCH_CACHE_TTL = 600.0
+_SEARCH_CACHE_MAX = 256
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared search client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        async with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.AsyncClient(
+                    timeout=30.0,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=10, max_connections=20
+                    ),
+                )
+    return _client
+
+
+@atexit.register
+def _close_client_at_exit() -> None:
+    """Best-effort close of the shared client at interpreter shutdown."""
+    client = _client
+    if client is not None and not client.is_closed:
+        try:
+            asyncio.run(client.aclose())
+        except RuntimeError:
+            pass  # a loop is still running or shut down; sockets die with us
+
 
 @register_tool(
     name="web_search",
@@ -19,18 +61,32 @@ if TYPE_CHECKING:
             "query": {
                 "type": "string",
                 "description": "Search query (be specific - include CVE numbers, tool names, versions)",
-            }
+            },
+            "depth": {
+                "type": "string",
+                "enum": ["basic", "advanced"],
+                "description": "Search depth: 'basic' is faster and cheaper, 'advanced' digs deeper (default: basic)",
+                "default": "basic",
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of sources to return (default: 5)",
+                "default": 5,
+            },
         },
         required=["query"],
     ),
     category="research",
+    cacheable=True,
+    cache_ttl=600.0,
+    singleflight=True,
 )
 async def web_search(arguments: dict, runtime: "Runtime") -> str:
     """
     Search the web using Tavily API.
 
     Args:
-        arguments: Dictionary with 'query'
+        arguments: Dictionary with 'query', optional 'depth' and 'max_results'
         runtime: The runtime environment
 
     Returns:
@@ -40,6 +96,11 @@ async def web_search(arguments: dict, runtime: "Runtime") -> str:
     if not query:
         return "Error: No search query provided"
 
+    depth = arguments.get("depth", "basic")
+    if depth not in ("basic", "advanced"):
+        depth = "basic"
+    max_results = arguments.get("max_results", 5)
+
     api_key = os.getenv("TAVILY_API_KEY")
     if not api_key:
         return (
@@ -47,23 +108,36 @@ async def web_search(arguments: dict, runtime: "Runtime") -> str:
             "Get a free API key at https://tavily.com (1000 searches/month free)"
         )
 
+    cache_key = f"{depth}:{max_results}:{query.lower()}"
+    entry = _search_cache.get(cache_key)
+    if entry is not None:
+        expires_at, cached = entry
+        if expires_at >= time.monotonic():
+            _search_cache.move_to_end(cache_key)
+            return cached
+        del _search_cache[cache_key]
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.tavily.com/search",
-                json={
-                    "api_key": api_key,
-                    "query": query,
-                    "search_depth": "advanced",
-                    "include_answer": True,
-                    "include_raw_content": False,
-                    "max_results": 5,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        return _format_results(query, data)
+        client = await _get_client()
+        response = await client.post(
+            "https://api.tavily.com/search",
+            json={
+                "api_key": api_key,
+                "query": query,
+                "search_depth": depth,
+                "include_answer": True,
+                "include_raw_content": False,
+                "max_results": max_results,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        formatted = _format_results(query, data)
+        if len(_search_cache) >= _SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+        _search_cache[cache_key] = (time.monotonic() + _SEARCH_CACHE_TTL, formatted)
+        return formatted
 
     except httpx.TimeoutException:
         return "Error: Search request timed out"
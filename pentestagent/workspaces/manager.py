@@ -3,9 +3,12 @@
 Design goals:
 - Workspace metadata stored as YAML at workspaces/{name}/meta.yaml
 - Active workspace marker stored at workspaces/.active
-- No in-memory caching: all operations read/write files directly
+- Files remain the source of truth: meta reads are memoized per stat
+  signature, so external edits are picked up while repeat reads skip
+  the YAML parse
 - Lightweight hostname validation; accept IPs, CIDRs, hostnames
 """
+import copy
 import ipaddress
 import logging
 import re
@@ -23,6 +26,11 @@ class WorkspaceError(Exception):
 WORKSPACES_DIR_NAME = "workspaces"
 NAME_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
 
+# meta path -> (st_mtime_ns, st_size, parsed dict). YAML parsing dominates
+# the scope-check hot path; entries are validated against stat on every
+# read and refreshed on write, and callers always get their own copy.
+_META_CACHE: dict = {}
+
 
 def _safe_mkdir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
@@ -108,8 +116,18 @@ class WorkspaceManager:
 
     def _read_meta(self, name: str) -> dict:
         mp = self.meta_path(name)
-        if not mp.exists():
+        try:
+            st = mp.stat()
+        except OSError:
             return {"name": name, "targets": []}
+        key = str(mp)
+        cached = _META_CACHE.get(key)
+        if (
+            cached is not None
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+        ):
+            return copy.deepcopy(cached[2])
         try:
             data = yaml.safe_load(mp.read_text(encoding="utf-8"))
             if data is None:
@@ -117,6 +135,7 @@ class WorkspaceManager:
             # ensure keys
             data.setdefault("name", name)
             data.setdefault("targets", [])
+            _META_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
             return data
         except Exception as e:
             raise WorkspaceError(f"Failed to read meta for {name}: {e}") from e
@@ -125,6 +144,11 @@ class WorkspaceManager:
         mp = self.meta_path(name)
         mp.parent.mkdir(parents=True, exist_ok=True)
         mp.write_text(yaml.safe_dump(meta, sort_keys=False), encoding="utf-8")
+        try:
+            st = mp.stat()
+            _META_CACHE[str(mp)] = (st.st_mtime_ns, st.st_size, copy.deepcopy(meta))
+        except OSError:
+            _META_CACHE.pop(str(mp), None)
 
     def set_active(self, name: str):
         # ensure workspace exists
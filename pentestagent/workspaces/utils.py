@@ -116,8 +116,8 @@ def export_workspace(name: str, output: Optional[Path] = None, root: Optional[Pa
 
     entries = sorted(entries, key=str)
 
-    # Create tar.gz
-    with tarfile.open(out_path, "w:gz") as tf:
+    # Create tar.gz; 128K buffer cuts write syscalls vs the 16K default
+    with tarfile.open(out_path, "w:gz", bufsize=131072) as tf:
         for rel in entries:
             full = root / rel
             # store with relative path (preserve workspaces/<name>/...)
@@ -126,8 +126,31 @@ def export_workspace(name: str, output: Optional[Path] = None, root: Optional[Pa
     return out_path
 
 
+def _extract_with_libarchive(archive: Path, dest: Path) -> None:
+    """Extract an archive via libarchive (C-level; handles zstd and more).
+
+    Mirrors tarfile's filter="data" sanitization: absolute paths and
+    parent-directory escapes are skipped.
+    """
+    import libarchive
+
+    for entry in libarchive.file_reader(str(archive)):
+        relpath = Path(entry.pathname.lstrip("/"))
+        if ".." in relpath.parts:
+            continue
+        target = dest / relpath
+        if entry.isdir:
+            target.mkdir(parents=True, exist_ok=True)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as fh:
+            for block in entry.get_blocks():
+                fh.write(block)
+
+
 def import_workspace(archive: Path, root: Optional[Path] = None) -> str:
-    """Import a workspace tar.gz into workspaces/. Returns workspace name.
+    """Import a workspace archive (tar.gz, or tar.zst with libarchive) into
+    workspaces/. Returns workspace name.
 
     Fails if workspace already exists. Requires meta.yaml present in archive.
     """
@@ -141,14 +164,37 @@ def import_workspace(archive: Path, root: Optional[Path] = None) -> str:
 
     with tempfile.TemporaryDirectory() as td:
         tdpath = Path(td)
-        with tarfile.open(archive, "r:gz") as tf:
-            tf.extractall(path=tdpath)
-
-        # Look for workspaces/<name>/meta.yaml or meta.yaml at root
-        candidates = list(tdpath.rglob("meta.yaml"))
-        if not candidates:
-            raise ValueError("No meta.yaml found in archive")
-        meta_file = candidates[0]
+        meta_file = None
+        if archive.name.endswith(".tar.zst"):
+            # zstd decompresses several times faster than gzip; the stdlib
+            # tarfile can't read it, so this format needs libarchive-c
+            try:
+                _extract_with_libarchive(archive, tdpath)
+            except ImportError:
+                raise ValueError(
+                    "Importing .tar.zst archives requires the libarchive-c package"
+                ) from None
+        else:
+            # Streaming mode: one sequential pass, no member index built in
+            # memory; filter="data" takes the sanitized fast path (and is the
+            # safe default Python 3.14 enforces anyway). The 128K block size
+            # keeps read syscalls per member low. meta.yaml is spotted during
+            # the same pass instead of re-walking the extracted tree after.
+            with tarfile.open(archive, "r|gz", bufsize=131072) as tf:
+                for member in tf:
+                    if meta_file is None and member.name.endswith("meta.yaml"):
+                        meta_file = tdpath / member.name
+                    tf.extract(member, path=tdpath, filter="data")
+            if meta_file is not None and not meta_file.exists():
+                meta_file = None
+
+        # Fall back to walking the tree (libarchive branch, or unexpected
+        # member paths)
+        if meta_file is None:
+            candidates = list(tdpath.rglob("meta.yaml"))
+            if not candidates:
+                raise ValueError("No meta.yaml found in archive")
+            meta_file = candidates[0]
         # read name
         import yaml
 
@@ -4,12 +4,61 @@ Provides helpers to extract candidate targets from arbitrary tool arguments
 and to determine whether a candidate target is covered by the allowed
 workspace targets (IP, CIDR, hostname).
 """
+import functools
 import ipaddress
 import logging
-from typing import Any, List
+import socket
+from typing import Any, FrozenSet, List, Optional, Tuple
 
 from .manager import TargetManager
 
+# Compiled allowlist entry: (ip version, network int, netmask int, prefixlen)
+_CompiledNet = Tuple[int, int, int, int]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_allowlist(
+    allowed: Tuple[str, ...],
+) -> Tuple[Tuple[_CompiledNet, ...], FrozenSet[str]]:
+    """Parse an allowlist once into integer networks and a hostname set.
+
+    Scope checks run on every tool call with the same allowlist, so the
+    per-call ip_network construction and subnet_of walks are hoisted here:
+    containment against a compiled entry is one mask-and-compare on ints.
+    Single IPs compile to full-length prefixes; anything that doesn't parse
+    as an address or network is treated as a hostname label.
+    """
+    nets: List[_CompiledNet] = []
+    hostnames = set()
+    for a in allowed:
+        if not isinstance(a, str):
+            continue
+        a = a.strip()
+        try:
+            if "/" in a:
+                net = ipaddress.ip_network(a, strict=False)
+            else:
+                net = ipaddress.ip_network(ipaddress.ip_address(a))
+            nets.append(
+                (net.version, int(net.network_address), int(net.netmask), net.prefixlen)
+            )
+        except ValueError:
+            hostnames.add(a.lower())
+    return tuple(nets), frozenset(hostnames)
+
+
+def _parse_v4(s: str) -> Optional[int]:
+    """Parse a strict dotted-quad IPv4 string to an int, or None.
+
+    inet_pton is a C-level parser that rejects shorthand and leading-zero
+    forms, so it accepts exactly the canonical strings normalize_target
+    emits — without building an IPv4Address object per scope check.
+    """
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, s), "big")
+    except OSError:
+        return None
+
 
 def gather_candidate_targets(obj: Any) -> List[str]:
     """
@@ -49,6 +98,44 @@ def gather_candidate_targets(obj: Any) -> List[str]:
     return candidates
 
 
+def _candidate_in_scope(
+    norm: str, nets: Tuple[_CompiledNet, ...], hostnames: FrozenSet[str]
+) -> bool:
+    """Check a normalized candidate against a compiled allowlist."""
+    # Resolve the candidate to (version, int, prefixlen); a candidate
+    # network is in scope iff its prefix is at least as long as an
+    # allowed entry's and the masked bits match
+    if "/" in norm:
+        cand_net = ipaddress.ip_network(norm, strict=False)
+        cand_ver = cand_net.version
+        cand_int = int(cand_net.network_address)
+        cand_prefix = cand_net.prefixlen
+    else:
+        v4 = _parse_v4(norm)
+        if v4 is not None:
+            # Hot path: plain IPv4 target, parsed without an
+            # ipaddress object
+            cand_ver, cand_int, cand_prefix = 4, v4, 32
+        else:
+            try:
+                cand_ip = ipaddress.ip_address(norm)
+            except ValueError:
+                # hostname candidate; compare case-insensitively
+                return norm.lower() in hostnames
+            cand_ver = cand_ip.version
+            cand_int = int(cand_ip)
+            cand_prefix = cand_ip.max_prefixlen
+
+    for version, net_int, mask, prefix in nets:
+        if (
+            version == cand_ver
+            and cand_prefix >= prefix
+            and (cand_int & mask) == net_int
+        ):
+            return True
+    return False
+
+
 def is_target_in_scope(candidate: str, allowed: List[str]) -> bool:
     """Check whether `candidate` is covered by any entry in `allowed`.
 
@@ -61,55 +148,33 @@ def is_target_in_scope(candidate: str, allowed: List[str]) -> bool:
     except Exception:
         return False
 
-    # If candidate is a network (contains '/'), treat as network
     try:
-        if "/" in norm:
-            cand_net = ipaddress.ip_network(norm, strict=False)
-            for a in allowed:
-                try:
-                    if "/" in a:
-                        an = ipaddress.ip_network(a, strict=False)
-                        if cand_net.subnet_of(an) or cand_net == an:
-                            return True
-                    else:
-                        # allowed is IP or hostname; accept only when candidate
-                        # network represents exactly one address equal to allowed IP
-                        try:
-                            allowed_ip = ipaddress.ip_address(a)
-                        except Exception:
-                            # not an IP (likely hostname) - skip
-                            continue
-                        if cand_net.num_addresses == 1 and cand_net.network_address == allowed_ip:
-                            return True
-                except Exception:
-                    continue
-            return False
-        else:
-            # candidate is a single IP/hostname
-            try:
-                cand_ip = ipaddress.ip_address(norm)
-                for a in allowed:
-                    try:
-                        if "/" in a:
-                            an = ipaddress.ip_network(a, strict=False)
-                            if cand_ip in an:
-                                return True
-                        else:
-                            if TargetManager.normalize_target(a) == norm:
-                                return True
-                    except Exception:
-                        if isinstance(a, str) and a.lower() == norm.lower():
-                            return True
-                return False
-            except Exception:
-                # candidate is likely a hostname; compare case-insensitively
-                for a in allowed:
-                    try:
-                        if a.lower() == norm.lower():
-                            return True
-                    except Exception:
-                        continue
-                return False
+        nets, hostnames = _compile_allowlist(tuple(allowed))
+        return _candidate_in_scope(norm, nets, hostnames)
     except Exception as e:
         logging.getLogger(__name__).exception("Error checking target scope: %s", e)
         return False
+
+
+def are_targets_in_scope(candidates: List[str], allowed: List[str]) -> List[bool]:
+    """Check many candidates against one allowlist in a single pass.
+
+    Compiles the allowlist once and reuses it for every candidate, so
+    checking the lists gather_candidate_targets produces costs one
+    compile plus N integer containment loops instead of N full checks.
+    Results are positional: `result[i]` corresponds to `candidates[i]`.
+    """
+    try:
+        nets, hostnames = _compile_allowlist(tuple(allowed))
+    except Exception as e:
+        logging.getLogger(__name__).exception("Error compiling allowlist: %s", e)
+        return [False] * len(candidates)
+
+    results: List[bool] = []
+    for candidate in candidates:
+        try:
+            norm = TargetManager.normalize_target(candidate)
+            results.append(_candidate_in_scope(norm, nets, hostnames))
+        except Exception:
+            results.append(False)
+    return results
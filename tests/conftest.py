@@ -1,6 +1,7 @@
 """Test fixtures for PentestAgent tests."""
 
 import asyncio
+import copy
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -11,9 +12,9 @@ from pentestagent.config import Settings
 from pentestagent.tools import Tool, ToolSchema
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def settings() -> Settings:
-    """Create test settings."""
+    """Create test settings (session-scoped; treat as read-only)."""
     return Settings(
         debug=True,
     )
@@ -25,9 +26,9 @@ def agent_state() -> AgentStateManager:
     return AgentStateManager()
 
 
-@pytest.fixture
-def mock_llm() -> MagicMock:
-    """Create a mock LLM."""
+@pytest.fixture(scope="session")
+def _mock_llm_template() -> MagicMock:
+    """Build the mock LLM object graph once per session."""
     mock = AsyncMock()
     mock.generate.return_value = MagicMock(
         content="Test response",
@@ -39,23 +40,35 @@ def mock_llm() -> MagicMock:
     return mock
 
 
+@pytest.fixture
+def mock_llm(_mock_llm_template: MagicMock) -> MagicMock:
+    """Create a mock LLM (copied from the session template)."""
+    mock = copy.copy(_mock_llm_template)
+    mock.reset_mock()
+    return mock
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for tests."""
     return tmp_path
 
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session", autouse=True)
+async def _session_loop_eager_tasks():
+    """Run eager tasks (3.12+) on the shared session event loop.
 
+    Replaces the legacy function-scoped event_loop override, which paid
+    loop construction and teardown for every async test; the loop scope
+    itself is set to session in pyproject.toml.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_finding() -> dict:
-    """Create a sample security finding."""
+    """Create a sample security finding (session-scoped; treat as read-only)."""
     return {
         "title": "SQL Injection in Login Form",
         "severity": "high",
@@ -66,9 +79,9 @@ def sample_finding() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tool_result() -> dict:
-    """Create a sample tool execution result."""
+    """Create a sample tool execution result (session-scoped; treat as read-only)."""
     return {
         "tool": "terminal",
         "success": True,
@@ -77,9 +90,9 @@ def sample_tool_result() -> dict:
     }
 
 
-@pytest.fixture
-def sample_tool() -> Tool:
-    """Create a sample tool for testing."""
+@pytest.fixture(scope="session")
+def _sample_tool_template() -> Tool:
+    """Build the sample tool (and its schema) once per session."""
     async def dummy_execute(arguments: dict, runtime) -> str:
         return f"Executed with: {arguments}"
 
@@ -93,3 +106,9 @@ def sample_tool() -> Tool:
         execute_fn=dummy_execute,
         category="test"
     )
+
+
+@pytest.fixture
+def sample_tool(_sample_tool_template: Tool) -> Tool:
+    """Create a sample tool for testing (copied from the session template)."""
+    return copy.copy(_sample_tool_template)
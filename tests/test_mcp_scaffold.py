@@ -1,4 +1,9 @@
 import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 
 from pentestagent.mcp.example_adapter import ExampleAdapter
@@ -20,3 +25,33 @@ def test_example_adapter_list_and_call():
         await adapter.stop()
 
     asyncio.run(run())
+
+
+def test_stdio_adapter_round_trip():
+    """Feed JSON-RPC frames to the stdio adapter and read the responses."""
+    env = {
+        **os.environ,
+        "STDIO_TOOLS": '[{"name":"http_api","description":"Generic HTTP proxy"}]',
+    }
+    frames = b"".join(
+        json.dumps(r).encode() + b"\n"
+        for r in [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-m", "pentestagent.mcp.stdio_adapter"],
+        input=frames,
+        capture_output=True,
+        timeout=30,
+        env=env,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
+
+    responses = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"] == {"capabilities": {}}
+    assert responses[1]["result"]["tools"][0]["name"] == "http_api"
@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+
+from pentestagent.runtime.runtime import LocalRuntime
+
+
+def _runtime_with_transport(handler) -> LocalRuntime:
+    runtime = LocalRuntime()
+    runtime._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return runtime
+
+
+def test_proxy_get_and_post_truncate_body():
+    """get/post bodies are sliced to the 10KB cap before decoding."""
+
+    def app(request):
+        return httpx.Response(200, content=b"x" * 50000)
+
+    runtime = _runtime_with_transport(app)
+
+    async def run():
+        try:
+            for action in ("get", "post"):
+                result = await runtime.proxy_action(action, url="http://t/x")
+                assert result["status_code"] == 200
+                assert result["body"] == "x" * 10000
+        finally:
+            await runtime._http_client.aclose()
+
+    asyncio.run(run())
+
+
+def test_proxy_request_stops_pulling_at_cap():
+    """The 'request' action stops draining the stream once the cap is hit."""
+    served = []
+
+    def app(request):
+        async def gen():
+            for _ in range(100):
+                served.append(1)
+                yield b"x" * 8192
+
+        return httpx.Response(200, content=gen())
+
+    runtime = _runtime_with_transport(app)
+
+    async def run():
+        try:
+            result = await runtime.proxy_action("request", url="http://t/x")
+            assert result["status_code"] == 200
+            assert result["body"] == "x" * 10000
+        finally:
+            await runtime._http_client.aclose()
+
+    asyncio.run(run())
+    assert len(served) < 100
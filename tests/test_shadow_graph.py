@@ -0,0 +1,36 @@
+from pentestagent.knowledge.graph import ShadowGraph
+
+NOTES = {
+    "creds_ssh": {
+        "content": "user: bob found on 10.0.0.5",
+        "category": "credential",
+    },
+    "vuln_sqli": {
+        "content": "CVE-2024-12345 exploitable on 10.0.0.5",
+        "category": "vulnerability",
+    },
+    "host_web": {
+        "content": "web server at 10.0.0.7",
+        "category": "recon",
+    },
+}
+
+
+def test_graph_round_trips_through_bytes():
+    """from_bytes(to_bytes()) preserves nodes, edges and processed notes."""
+    graph = ShadowGraph()
+    graph.update_from_notes(NOTES)
+    assert graph.graph.number_of_nodes() > 0
+
+    restored = ShadowGraph.from_bytes(graph.to_bytes())
+
+    assert restored.graph.number_of_nodes() == graph.graph.number_of_nodes()
+    assert restored.graph.number_of_edges() == graph.graph.number_of_edges()
+    assert set(restored.graph.nodes) == set(graph.graph.nodes)
+    assert dict(restored.graph.nodes(data=True)) == dict(graph.graph.nodes(data=True))
+
+    # Processed-note tracking survives, so re-feeding the same notes
+    # stays a no-op on the restored instance too
+    restored.update_from_notes(NOTES)
+    assert restored.graph.number_of_nodes() == graph.graph.number_of_nodes()
+    assert restored.graph.number_of_edges() == graph.graph.number_of_edges()